@@ -5,7 +5,9 @@
 
 from pandas_profiling.config import Config, config
 from pandas_profiling.controller import pandas_decorator
+from pandas_profiling.model.describe_cache import describe_cache
 from pandas_profiling.profile_report import ProfileReport
 from pandas_profiling.version import __version__
 
 clear_config = ProfileReport.clear_config
+clear_describe_cache = describe_cache.clear
@@ -1,21 +1,83 @@
 """Configuration for the package is handled in this wrapper for confuse."""
 import argparse
 from pathlib import Path
-from typing import Union
+from typing import Optional, Union
 
 import confuse
 
 from pandas_profiling.utils.paths import get_config_default
 
 
+class _Configuration(confuse.Configuration):
+    """A confuse configuration that counts its changes, so that values read from it can be cached.
+
+    Every change to a confuse configuration adds, inserts or clears its sources.
+    """
+
+    version = 0
+
+    def add(self, obj):
+        super().add(obj)
+        self.version += 1
+
+    def set(self, value):
+        super().set(value)
+        self.version += 1
+
+    def clear(self):
+        super().clear()
+        self.version += 1
+
+
 class Config(object):
     """This is a wrapper for the python confuse package, which handles setting and getting configuration variables via
     various ways (notably via argparse and kwargs).
     """
 
-    config = None
+    config: Optional[_Configuration] = None
     """The confuse.Configuration object."""
 
+    _snapshot = None
+    _snapshot_version = None
+
+    _snapshot_template = {
+        "memory_deep": bool,
+        "vars": {
+            "num": {
+                "quantiles": list,
+                "chi_squared_threshold": float,
+                "low_categorical_threshold": int,
+            },
+            "cat": {
+                "length": bool,
+                "unicode": bool,
+                "cardinality_threshold": int,
+                "chi_squared_threshold": float,
+            },
+            "image": {"exif": bool},
+        },
+        "spark": {
+            "to_pandas_limit": int,
+            "quantile_error": float,
+            "length_values_sample": int,
+            "histogram_bins": int,
+        },
+        "plot": {
+            "image_format": str,
+            "dpi": int,
+            "scatter_threshold": int,
+            "histogram": {"bins": int, "max_bins": int, "x_axis_labels": bool},
+            "correlation": {"cmap": str, "bad": str},
+            "missing": {"cmap": str, "force_labels": bool},
+        },
+        "html": {
+            "inline": bool,
+            "file_name": str,
+            "style": {"primary_color": str},
+        },
+    }
+    """The settings in the snapshot, with their types."""
+
     def __init__(self):
         """The config constructor should be called only once."""
         if self.config is None:
@@ -150,6 +212,23 @@ class Config(object):
     def __getitem__(self, item):
         return self.config[item]
 
+    def snapshot(self) -> dict:
+        """
+        The settings that are read per column or per plot as a plain dictionary, see `_snapshot_template`.
+
+        Looking up a value in confuse walks all its sources, looking it up in the snapshot is a dictionary lookup.
+        The values are read with their typed getters, and are cached until the configuration changes.
+
+        Returns:
+            The settings, which should not be modified.
+        """
+        assert self.config is not None
+        version = (self.config, self.config.version)
+        if self._snapshot is None or self._snapshot_version != version:
+            self._snapshot = _read_template(self.config, self._snapshot_template)
+            self._snapshot_version = version
+        return self._snapshot
+
     def __setitem__(self, key, value):
         value = self._handle_shorthand(key, value)
         self.config[key].set(value)
@@ -163,7 +242,7 @@ class Config(object):
         self.config = other.config
 
     def clear(self):
-        self.config = confuse.Configuration("PandasProfiling", __name__, read=False)
+        self.config = _Configuration("PandasProfiling", __name__, read=False)
         self.set_file(str(get_config_default()))
 
     @property
@@ -175,4 +254,13 @@ class Config(object):
         return isinstance(other, Config) and self.dump() == other.dump()
 
 
+def _read_template(view, template: dict) -> dict:
+    return {
+        key: _read_template(view[key], value)
+        if isinstance(value, dict)
+        else view[key].get(value)
+        for key, value in template.items()
+    }
+
+
 config = Config()
@@ -35,7 +35,7 @@ class Correlation:
     @compute.register(PandasDataFrame)
     @staticmethod
     def _(df: PandasDataFrame, summary) -> Optional[pd.DataFrame]:
-        return NotImplemented
+        raise NotImplementedError()
 
 
 class Spearman(Correlation):
@@ -1,5 +1,5 @@
 from abc import ABC, abstractmethod
-from typing import List, Tuple
+from typing import Dict, List, Tuple
 
 import numpy as np
 import pandas as pd
@@ -46,6 +46,9 @@ class GenericDataFrame(ABC):
 
     """
 
+    # wrappers are created for every (sub)frame that is profiled, slots keep them small
+    __slots__ = ("df",)
+
     def __init__(self):
         # self.df holds the underlying data object
         self.df = None
@@ -221,6 +224,8 @@ class PandasDataFrame(GenericDataFrame):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, df):
         super().__init__()
         # self.df holds the underlying data object
@@ -291,15 +296,17 @@ class PandasDataFrame(GenericDataFrame):
         Returns:
 
         """
-        return len(self.df[self.df.duplicated(subset=subset, keep="first")])
+        return int(self.df.duplicated(subset=subset, keep="first").sum())
 
     def dropna(self, subset) -> "PandasDataFrame":
         return PandasDataFrame(self.df.dropna(subset=subset))
 
     def groupby_get_n_largest_dups(self, columns, n) -> pd.DataFrame:
+        # Only the duplicated rows are grouped, and only the observed categories of categorical columns: the
+        # groups of all their combinations would not fit in memory
         return (
             self.df[self.df.duplicated(subset=columns, keep=False)]
-            .groupby(columns)
+            .groupby(columns, observed=True)
             .size()
             .reset_index(name="count")
             .nlargest(n, "count")
@@ -357,16 +364,24 @@ class PandasDataFrame(GenericDataFrame):
         return [(i[0], PandasSeries(i[1])) for i in self.df.iteritems()]
 
 
+# the module and name of the spark DataFrame class, compared against instead of importing pyspark
+_spark_dataframe_type = ("pyspark.sql.dataframe", "DataFrame")
+
+
 class SparkDataFrame(GenericDataFrame):
     """
     A lot of optimisations left to do (persisting, caching etc), but when functionality completed
 
     """
 
+    __slots__ = ("persist_bool", "dropna", "as_vector", "_n_rows", "_column_kinds")
+
     def __init__(self, df, persist=True):
         super().__init__()
         self.df = df
         self.persist_bool = persist
+        self._n_rows = None
+        self._column_kinds = None
         df_without_na = self.df.na.drop()
         df_without_na.persist()
         self.dropna = df_without_na
@@ -394,10 +409,8 @@ class SparkDataFrame(GenericDataFrame):
         Returns: True if the __module__ and __name__ of object matches spark dataframe, else false
 
         """
-        return (
-            type(obj).__module__ == "pyspark.sql.dataframe"
-            and type(obj).__name__ == "DataFrame"
-        )
+        obj_type = type(obj)
+        return (obj_type.__module__, obj_type.__name__) == _spark_dataframe_type
 
     @staticmethod
     def get_numeric_types():
@@ -441,37 +454,34 @@ class SparkDataFrame(GenericDataFrame):
 
     @property
     def n_rows(self) -> int:
-        return self.df.count()
+        if self._n_rows is None:
+            self._n_rows = self.df.count()
+        return self._n_rows
 
     def get_columns(self) -> List[str]:
         return self.df.columns
 
+    def _get_column_kinds(self) -> Dict[str, List[str]]:
+        # classify the columns of df as numeric or categorical in a single pass over the schema
+        if self._column_kinds is None:
+            numeric_types = tuple(self.get_numeric_types())
+            categorical_types = tuple(self.get_categorical_types())
+            column_kinds: Dict[str, List[str]] = {"numeric": [], "categorical": []}
+            for field in self.schema:
+                if isinstance(field.dataType, numeric_types):
+                    column_kinds["numeric"].append(field.name)
+                elif isinstance(field.dataType, categorical_types):
+                    column_kinds["categorical"].append(field.name)
+            self._column_kinds = column_kinds
+        return self._column_kinds
+
     def get_numeric_columns(self) -> List[str]:
         # get columns of df that are numeric as a list
-        numeric_columns = []
-        for field in self.schema:
-            if np.any(
-                list(
-                    isinstance(field.dataType, d_type)
-                    for d_type in self.get_numeric_types()
-                )
-            ):
-                numeric_columns.append(field.name)
-        return numeric_columns
+        return list(self._get_column_kinds()["numeric"])
 
     def get_categorical_columns(self) -> List[str]:
-        # get columns of df that are numeric as a list
-        categorical_columns = []
-        for field in self.schema:
-            if np.any(
-                list(
-                    isinstance(field.dataType, d_type)
-                    for d_type in self.get_categorical_types()
-                )
-            ):
-                categorical_columns.append(field.name)
-
-        return categorical_columns
+        # get columns of df that are categorical as a list
+        return list(self._get_column_kinds()["categorical"])
 
     def head(self, n):
         return pd.DataFrame(self.df.head(n), columns=self.columns)
@@ -540,14 +550,10 @@ class SparkDataFrame(GenericDataFrame):
         )
 
     def get_duplicate_rows_count(self, subset: List[str]) -> int:
-        # number of unique rows -> self.dropna.distinct().count()
-        # number of deduplicated rows - > self.dropna.dropDuplicates().count()
-        # number of deduplicated rows - number of unique rows = number of duplicate rows
-        num_duplicates = (
-            self.dropna.dropDuplicates().count() - self.dropna.distinct().count()
-        )
-
-        return num_duplicates
+        # every row after the first of each distinct combination of the subset is a duplicate, with missing
+        # values equal to each other (as in pandas' duplicated(keep="first")).
+        # The number of rows is cached, so this is a single distinct count over the subset
+        return self.n_rows - self.df.select(*subset).distinct().count()
 
     def nan_counts(self):
         """
@@ -577,6 +583,8 @@ class SparkDataFrame(GenericDataFrame):
     def unpersist(self):
         if self.persist_bool:
             self.df.unpersist()
+        # the DataFrame without NAs is always persisted, see __init__
+        self.dropna.unpersist()
 
     def __getitem__(self, key):
         return self.df.select(key)
@@ -1,5 +1,6 @@
 """Organize the calculation of statistics for each series in this DataFrame."""
 import warnings
+from contextlib import contextmanager
 from datetime import datetime
 from typing import Optional
 
@@ -27,6 +28,25 @@ from pandas_profiling.utils.dataframe import get_appropriate_wrapper
 from pandas_profiling.version import __version__
 
 
+@contextmanager
+def persisted(df: GenericDataFrame):
+    """Persist a spark DataFrame while it is being described, so that its source is read only once, and release
+    it afterwards. Other DataFrames are left as they are.
+
+    Args:
+        df: the DataFrame
+    """
+    if not isinstance(df, SparkDataFrame):
+        yield
+        return
+
+    df.persist()
+    try:
+        yield
+    finally:
+        df.unpersist()
+
+
 def describe(
     title: str, df: GenericDataFrame, summarizer, typeset, sample: Optional[dict] = None
 ) -> dict:
@@ -64,13 +84,8 @@ def describe(
         # test if the version pyspark and pyarrow versions are compatible
         test_for_pyspark_pyarrow_incompatibility()
 
-        # save the dataframe to speed up compute time
-
-        if config["spark"]["persist"]:
-            df.persist_bool = config["spark"]["persist"]
-            df.persist()
-        else:
-            df.persist_bool = False
+        # save the dataframe to speed up compute time (see persisted)
+        df.persist_bool = config["spark"]["persist"].get(bool)
 
     disable_progress_bar = not config["progress_bar"].get(bool)
 
@@ -99,24 +114,19 @@ def describe(
 
     with tqdm(
         total=number_of_tasks, desc="Summarize dataset", disable=disable_progress_bar
-    ) as pbar:
+    ) as pbar, persisted(df):
         series_description = get_series_descriptions(df, summarizer, typeset, pbar)
         pbar.set_postfix_str("Get variable types")
-        variables = {
-            column: description["type"]
-            for column, description in series_description.items()
-        }
-
-        supported_columns = [
-            column
-            for column, type_name in variables.items()
-            if type_name != Unsupported
-        ]
-        interval_columns = [
-            column
-            for column, type_name in variables.items()
-            if type_name == Numeric or type_name == SparkNumeric
-        ]
+        variables = {}
+        supported_columns = []
+        interval_columns = []
+        for column, description in series_description.items():
+            type_name = description["type"]
+            variables[column] = type_name
+            if type_name != Unsupported:
+                supported_columns.append(column)
+            if type_name == Numeric or type_name == SparkNumeric:
+                interval_columns.append(column)
         pbar.update()
 
         # Get correlations
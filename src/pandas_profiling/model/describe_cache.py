@@ -0,0 +1,131 @@
+"""Cache the descriptions of series, so that re-profiling unchanged data is instant."""
+import hashlib
+from collections import OrderedDict
+from typing import Optional
+
+import numpy as np
+import pandas as pd
+
+from pandas_profiling.config import config
+
+
+def config_fingerprint() -> str:
+    """Serialize the configuration, all of which may be read while describing a series.
+
+    Returns:
+        A string that changes whenever the configuration changes.
+    """
+    return config.dump()
+
+
+def summarizer_fingerprint(summarizer) -> frozenset:
+    """The summary functions per type, summarizers with the same functions describe series identically.
+
+    Args:
+        summarizer: the summarizer
+
+    Returns:
+        A hashable representation of the summary map of the summarizer.
+    """
+    return frozenset(
+        (dtype, tuple(functions)) for dtype, functions in summarizer.summary_map.items()
+    )
+
+
+# numpy dtypes whose values are identified exactly by their bytes (bool, integer, float, complex and datetime)
+_cacheable_kinds = "biufcmM"
+
+
+class DescribeCache:
+    """A LRU cache of series descriptions.
+
+    Descriptions are keyed on the name, dtype and content of the series, the summarizer and typeset used and the
+    configuration. Only series with at most `max_rows` rows are cached and the cache holds descriptions for at
+    most `max_total_rows` rows in total, as descriptions contain series that scale with the number of rows.
+
+    Only series of numpy dtypes of fixed size are cached, they are keyed on a digest of the bytes of their values.
+    Object and extension dtypes are not: their hashes do not tell apart e.g. True and 1 or None and NaN, which
+    are inferred as different types. The memory size of a series depends on its index and is not cached.
+    """
+
+    def __init__(
+        self,
+        max_size: int = 1024,
+        max_rows: int = 1_000_000,
+        max_total_rows: int = 10_000_000,
+    ):
+        self.max_size = max_size
+        self.max_rows = max_rows
+        self.max_total_rows = max_total_rows
+        self._cache: "OrderedDict[tuple, dict]" = OrderedDict()
+        self._total_rows = 0
+
+    def key(
+        self, series: pd.Series, summarizer, typeset, fingerprint: str
+    ) -> Optional[tuple]:
+        """Compute the cache key of a series.
+
+        Args:
+            series: the series to describe
+            summarizer: the summarizer used to describe the series
+            typeset: the typeset used to infer the type of the series
+            fingerprint: the configuration fingerprint, see `config_fingerprint`
+
+        Returns:
+            The cache key, or None when the series should not be cached.
+        """
+        if len(series) > self.max_rows:
+            return None
+
+        if not (
+            isinstance(series.dtype, np.dtype) and series.dtype.kind in _cacheable_kinds
+        ):
+            return None
+
+        content_hash = hashlib.sha1(
+            np.ascontiguousarray(series.values).view(np.uint8).data
+        ).hexdigest()
+        return (
+            summarizer_fingerprint(summarizer),
+            frozenset(typeset.types),
+            series.name,
+            str(series.dtype),
+            len(series),
+            content_hash,
+            fingerprint,
+        )
+
+    def get(self, key: Optional[tuple]) -> Optional[dict]:
+        if key is None or key not in self._cache:
+            return None
+
+        self._cache.move_to_end(key)
+        return dict(self._cache[key])
+
+    def put(self, key: Optional[tuple], description: dict) -> None:
+        if key is None:
+            return
+
+        if key not in self._cache:
+            # the number of rows is part of the key
+            self._total_rows += key[4]
+        self._cache[key] = {
+            name: value for name, value in description.items() if name != "memory_size"
+        }
+        self._cache.move_to_end(key)
+
+        while (
+            len(self._cache) > self.max_size or self._total_rows > self.max_total_rows
+        ):
+            oldest, _ = self._cache.popitem(last=False)
+            self._total_rows -= oldest[4]
+
+    def clear(self) -> None:
+        self._cache.clear()
+        self._total_rows = 0
+
+    def __len__(self) -> int:
+        return len(self._cache)
+
+
+describe_cache = DescribeCache()
@@ -123,8 +123,8 @@ def check_table_messages(table: dict) -> List[Message]:
 def numeric_warnings(summary: dict) -> List[Message]:
     messages = []
 
-    chi_squared_threshold_num = config["vars"]["num"]["chi_squared_threshold"].get(
-        float
+    chi_squared_threshold_num = float(
+        config.snapshot()["vars"]["num"]["chi_squared_threshold"]
     )
 
     # Skewness
@@ -166,10 +166,9 @@ def numeric_warnings(summary: dict) -> List[Message]:
 def categorical_warnings(summary: dict) -> List[Message]:
     messages = []
 
-    cardinality_threshold_cat = config["vars"]["cat"]["cardinality_threshold"].get(int)
-    chi_squared_threshold_cat = config["vars"]["cat"]["chi_squared_threshold"].get(
-        float
-    )
+    cat_config = config.snapshot()["vars"]["cat"]
+    cardinality_threshold_cat = int(cat_config["cardinality_threshold"])
+    chi_squared_threshold_cat = float(cat_config["chi_squared_threshold"])
 
     # High cardinality
     if summary["n_distinct"] > cardinality_threshold_cat:
@@ -10,7 +10,7 @@ from pandas_profiling.model.dataframe_wrappers import (
 )
 
 
-@attr.s
+@attr.s(slots=True, frozen=True)
 class Sample(object):
     id = attr.ib()
     data = attr.ib()
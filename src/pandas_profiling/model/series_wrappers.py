@@ -1,7 +1,7 @@
 from abc import ABC, abstractmethod
-from functools import lru_cache
 
 import attr
+import pandas as pd
 
 UNWRAPPED_SERIES_WARNING = """Attempting to pass a pandas series directly into a function that takes a wrapped series, 
                      this function will attempt to automatically wrap this in a pandas_profiling series wrapper,
@@ -14,7 +14,28 @@ UNWRAPPED_SERIES_WARNING = """Attempting to pass a pandas series directly into a
                      and pass that into the function directly """
 
 
-@attr.s
+def spark_to_pandas(df) -> pd.DataFrame:
+    """Collect a spark DataFrame into a pandas DataFrame.
+
+    Unlike `toPandas`, which sends every row to the driver and builds the DataFrame there, each partition is
+    converted to a pandas DataFrame on the executors and the driver only concatenates them.
+
+    Args:
+        df: the spark DataFrame
+
+    Returns:
+        The pandas DataFrame.
+    """
+    columns = df.columns
+    partitions = df.rdd.mapPartitions(
+        lambda rows: [pd.DataFrame(list(rows), columns=columns)]
+    ).collect()
+    if len(partitions) == 0:
+        return pd.DataFrame(columns=columns)
+    return pd.concat(partitions, ignore_index=True)
+
+
+@attr.s(slots=True, frozen=True)
 class Sample(object):
     id = attr.ib()
     data = attr.ib()
@@ -23,6 +44,9 @@ class Sample(object):
 
 
 class GenericSeries(ABC):
+    # the wrappers are created per column, slots keep them small
+    __slots__ = ("series",)
+
     def __init__(self, series):
         self.series = series
 
@@ -37,6 +61,8 @@ class PandasSeries(GenericSeries):
 
     """
 
+    __slots__ = ()
+
     def __init__(self, series):
         super().__init__(series)
         self.series = series
@@ -52,31 +78,49 @@ class SparkSeries(GenericSeries):
     """
     A lot of optimisations left to do (persisting, caching etc), but when functionality completed
 
+    The series without missing values and the value counts are computed once and persisted, as most summaries are
+    computed from them. `unpersist` releases them together with the series.
+
     TO-DO Also SparkSeries does a lot more than PandasSeries now, likely abstraction issue
-    TO-DO .na.drop() is called multiple times, can we optimise this?
     """
 
+    __slots__ = (
+        "persist_bool",
+        "dropna",
+        "_name",
+        "_type",
+        "_value_counts",
+        "_row_stats",
+    )
+
     def __init__(self, series, persist=True):
         super().__init__(series)
         from pyspark.sql.functions import array, map_keys, map_values
         from pyspark.sql.types import MapType
 
+        # the name and type are read by most summaries, every lookup is a call into the JVM
+        self._name = series.columns[0]
+        self._type = series.schema.fields[0].dataType
+
         # if series type is dict, handle that separately
-        if isinstance(self.series.schema[0].dataType, MapType):
+        if isinstance(self._type, MapType):
             series= series.select(array(map_keys(series[self.name]), map_values(series[self.name])).alias(self.name))
+            self._type = series.schema.fields[0].dataType
         self.series = series
         self.persist_bool = persist
         series_without_na = self.series.na.drop()
         series_without_na.persist()
         self.dropna = series_without_na
+        self._value_counts = None
+        self._row_stats = None
 
     @property
     def type(self):
-        return self.series.schema.fields[0].dataType
+        return self._type
 
     @property
     def name(self):
-        return self.series.columns[0]
+        return self._name
 
     @property
     def empty(self) -> bool:
@@ -84,32 +128,87 @@ class SparkSeries(GenericSeries):
 
     def unpersist_series_without_na(self):
         """
-        Useful wrapper for getting the internal data series but with NAs dropped
-        Returns: internal spark series without nans
-
+        Release the persisted series without NAs and the value counts computed from it
         """
         self.dropna.unpersist()
+        if self._value_counts is not None:
+            self._value_counts.unpersist()
 
     def fillna(self, fill=None) -> "SparkSeries":
-        if fill is not None:
-            return SparkSeries(self.series.na.fill(fill), persist=self.persist_bool)
-        else:
-            return SparkSeries(self.series.na.fillna(), persist=self.persist_bool)
+        """
+        Fill the missing values, by default with the zero value of the type (0, "" or False)
+        """
+        import pyspark.sql.functions as F
+        from pyspark.sql.types import (
+            BooleanType,
+            DoubleType,
+            FloatType,
+            NumericType,
+            StringType,
+        )
+
+        if fill is None:
+            if isinstance(self.type, NumericType):
+                fill = 0
+            elif isinstance(self.type, StringType):
+                fill = ""
+            elif isinstance(self.type, BooleanType):
+                fill = False
+            else:
+                return self
+
+        # a single projection of the column, na.fill checks every column of the frame
+        column = F.coalesce(F.col(self.name), F.lit(fill))
+        if isinstance(self.type, (DoubleType, FloatType)):
+            # like na.fill, also replace NaN
+            column = F.nanvl(column, F.lit(fill))
+        filled = self.series.select(column.alias(self.name))
+        return SparkSeries(filled, persist=self.persist_bool)
+
+    def row_stats(self):
+        """
+        The number of rows and of missing values, computed (once) in a single aggregation
+        """
+        # cached on the instance rather than with lru_cache, which would keep every series alive
+        if self._row_stats is not None:
+            return self._row_stats
+
+        import pyspark.sql.functions as F
+        from pyspark.sql.types import DoubleType, FloatType
+
+        # missing as in series.na.drop(), which also drops NaN
+        missing = F.col(self.name).isNull()
+        if isinstance(self.type, (DoubleType, FloatType)):
+            missing = missing | F.isnan(self.name)
+
+        row_stats = self.series.agg(
+            F.count(F.lit(1)).alias("n_rows"),
+            F.sum(missing.cast("long")).alias("n_missing"),
+        ).first()
+        # the sum is null when there are no rows
+        self._row_stats = row_stats["n_rows"], row_stats["n_missing"] or 0
+        return self._row_stats
 
     @property
-    @lru_cache()
     def n_rows(self) -> int:
-        return self.series.count()
+        return self.row_stats()[0]
 
-    def value_counts(self):
+    def value_counts(self, n=None):
         """
 
         Args:
-            n: by default, get only 1000
+            n: if given, only the n most common values, ordered by count. Spark plans the ordering and limit as a
+                top n per partition instead of sorting all the counts.
 
         Returns:
 
         """
+        if n is not None:
+            return self.value_counts().orderBy("count", ascending=False).limit(n)
+
+        # the value counts are used by several summaries, only compute (and persist) them once
+        if self._value_counts is not None:
+            return self._value_counts
 
         from pyspark.sql.functions import array, map_keys, map_values
         from pyspark.sql.types import MapType
@@ -117,31 +216,64 @@ class SparkSeries(GenericSeries):
         # if series type is dict, handle that separately
         if isinstance(self.series.schema[0].dataType, MapType):
             new_df = self.dropna.groupby(
-                map_keys(self.series[self.name]).alias("key"),
-                map_values(self.series[self.name]).alias("value"),
+                map_keys(self.dropna[self.name]).alias("key"),
+                map_values(self.dropna[self.name]).alias("value"),
             ).count()
-            value_counts = (
-                new_df.withColumn(self.name, array(new_df["key"], new_df["value"]))
-                .select(self.name, "count")
-                .orderBy("count", ascending=False)
-            )
+            value_counts = new_df.withColumn(
+                self.name, array(new_df["key"], new_df["value"])
+            ).select(self.name, "count")
         else:
             value_counts = self.dropna.groupBy(self.name).count()
         value_counts.persist()
+        self._value_counts = value_counts
         return value_counts
 
-    @lru_cache()
     def count_na(self):
-        return self.n_rows - self.dropna.count()
+        return self.row_stats()[1]
 
     def __len__(self):
         return self.n_rows
 
     def memory_usage(self, deep):
         """
-        Warning! this memory usage is only a sample
-        TO-DO can we make this faster or not use a sample?
+        Warning! this memory usage is only an estimate
+
+        Fixed width types (and all types when not deep) are estimated from the schema, other types from the size
+        statistics spark computes for the query plan, neither runs a job. Only when spark has no statistics a sample
+        is collected.
         """
+        import pyspark.sql.types as T
+
+        # bytes per value of the column when converted to pandas, objects take a pointer when not deep
+        fixed_width_types = {
+            T.BooleanType: 1,
+            T.ByteType: 1,
+            T.ShortType: 2,
+            T.IntegerType: 4,
+            T.LongType: 8,
+            T.FloatType: 4,
+            T.DoubleType: 8,
+            T.DateType: 8,
+            T.TimestampType: 8,
+        }
+        width = fixed_width_types.get(type(self.type), None if deep else 8)
+        if width is not None:
+            return self.n_rows * width
+
+        try:
+            size = int(
+                self.series._jdf.queryExecution()
+                .optimizedPlan()
+                .stats()
+                .sizeInBytes()
+                .toString()
+            )
+            # spark falls back to spark.sql.defaultSizeInBytes (Long.MaxValue) when the size is unknown
+            if size < 2 ** 63 - 1:
+                return size
+        except Exception:
+            pass
+
         sample = self.n_rows ** (1 / 3)
         percentage = sample / self.n_rows
         inverse_percentage = 1 / percentage
@@ -163,6 +295,7 @@ class SparkSeries(GenericSeries):
     def unpersist(self):
         if self.persist_bool:
             self.series.unpersist()
+        self.unpersist_series_without_na()
 
     def distinct(self):
         return self.dropna.distinct().count()
@@ -66,13 +66,20 @@ class BaseSummarizer:
                 self.summary_map[from_type] + self.summary_map[to_type]
             )
 
+        # the summary functions are fixed from here on, compose them once per type
+        self._composed = {
+            dtype: compose(functions) for dtype, functions in self.summary_map.items()
+        }
+        # types without summary functions are described by their type only
+        self._no_summary = compose([])
+
     def summarize(self, series, dtype: Type[VisionsBaseType]) -> dict:
         """
 
         Returns:
             object:
         """
-        summarizer_func = compose(self.summary_map.get(dtype, []))
+        summarizer_func = self._composed.get(dtype, self._no_summary)
         _, summary = summarizer_func(series, {"type": dtype})
         return summary
 
@@ -141,17 +148,20 @@ def format_summary(summary):
     def fmt(v):
         if isinstance(v, dict):
             return {k: fmt(va) for k, va in v.items()}
+        elif isinstance(v, pd.Series):
+            # only the values of object series can hold anything but scalars
+            if v.dtype != object:
+                return v.to_dict()
+            return fmt(v.to_dict())
+        elif (
+            isinstance(v, tuple)
+            and len(v) == 2
+            and type(v[0]) is np.ndarray
+            and type(v[1]) is np.ndarray
+        ):
+            return {"counts": v[0].tolist(), "bin_edges": v[1].tolist()}
         else:
-            if isinstance(v, pd.Series):
-                return fmt(v.to_dict())
-            elif (
-                isinstance(v, tuple)
-                and len(v) == 2
-                and all(isinstance(x, np.ndarray) for x in v)
-            ):
-                return {"counts": v[0].tolist(), "bin_edges": v[1].tolist()}
-            else:
-                return v
+            return v
 
     summary = {k: fmt(v) for k, v in summary.items()}
     return summary
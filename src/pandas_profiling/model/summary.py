@@ -1,14 +1,16 @@
 """Compute statistical description of datasets."""
 
+import itertools
 import multiprocessing
 import multiprocessing.pool
+import sys
 import warnings
-from collections import Counter
 from functools import singledispatch
-from typing import Any, Callable, Mapping, Tuple
+from typing import Any, Callable, Iterable, List, Mapping, Optional, Tuple
 
 import numpy as np
 import pandas as pd
+from tqdm.auto import tqdm
 
 from pandas_profiling.config import config as config
 from pandas_profiling.model.dataframe_wrappers import (
@@ -17,6 +19,7 @@ from pandas_profiling.model.dataframe_wrappers import (
     PandasDataFrame,
     SparkDataFrame,
 )
+from pandas_profiling.model.describe_cache import config_fingerprint, describe_cache
 from pandas_profiling.model.messages import (  # warning_type_date,
     check_correlation_messages,
     check_table_messages,
@@ -29,19 +32,23 @@ from pandas_profiling.model.series_wrappers import (
 )
 from pandas_profiling.model.summarizer import BaseSummarizer
 from pandas_profiling.model.typeset import (
+    URL,
+    Categorical,
+    File,
+    Image,
+    Path,
     SparkCategorical,
     SparkNumeric,
     SparkUnsupported,
     Unsupported,
+    infer_and_cast,
 )
-from pandas_profiling.utils.dataframe import get_appropriate_wrapper
-from pandas_profiling.visualisation.missing import (
-    missing_bar,
-    missing_dendrogram,
-    missing_heatmap,
-    missing_matrix,
+from pandas_profiling.utils.dataframe import downcast_integers, get_appropriate_wrapper
+from pandas_profiling.visualisation.plot import (
+    scatter_pairwise,
+    spark_scatter_counts,
+    spark_scatter_pairwise,
 )
-from pandas_profiling.visualisation.plot import scatter_pairwise, spark_scatter_pairwise
 
 
 @singledispatch
@@ -83,16 +90,32 @@ def _describe_1d_pandas(
     """
 
     # Make sure pd.NA is not in the series, final .series call is to unwrap the series to get back our pd.Series
-    series = series.fillna(np.nan).series
+    # Only object dtypes and extension dtypes with pd.NA as missing value (e.g. Int64, string) can hold pd.NA,
+    # numpy dtypes and extension dtypes such as category or datetime64[ns, tz] do not need the copy
+    dtype = series.series.dtype
+    if dtype == object or getattr(dtype, "na_value", None) is pd.NA:
+        series = series.fillna(np.nan)
+    series = series.series
     # Infer variable types
     # vtype = Unsupported
 
-    vtype = typeset.infer_type(series)
-    series = typeset.cast_to_inferred(series)
+    vtype, series = infer_and_cast(typeset, series)
 
     return summarizer.summarize(series, dtype=vtype)
 
 
+# the spark types only depend on the data type of the column (see their contains_op), so look them up by name
+# instead of testing the series against each type in turn
+_spark_vtypes = {
+    "DoubleType": SparkNumeric,
+    "LongType": SparkNumeric,
+    "IntegerType": SparkNumeric,
+    "ShortType": SparkNumeric,
+    "FloatType": SparkNumeric,
+    "StringType": SparkCategorical,
+}
+
+
 @describe_1d.register(SparkSeries)
 def _describe_1d_spark(
     series: SparkSeries, summarizer: BaseSummarizer, typeset
@@ -105,11 +128,7 @@ def _describe_1d_spark(
     Returns:
         A Series containing calculated series description values.
     """
-    vtype: Any = SparkUnsupported
-    if series in SparkNumeric:
-        vtype = SparkNumeric
-    elif series in SparkCategorical:
-        vtype = SparkCategorical
+    vtype: Any = _spark_vtypes.get(str(series.type), SparkUnsupported)
 
     # Infer variable types
     # vtype = Unsupported
@@ -121,15 +140,109 @@ def _describe_1d_spark(
     return results
 
 
-def sort_column_names(dct: Mapping, sort: str):
+def sort_columns(columns: Iterable[str], sort: str) -> list:
     sort = sort.lower()
     if sort.startswith("asc"):
-        dct = dict(sorted(dct.items(), key=lambda x: x[0].casefold()))
+        columns = sorted(columns, key=str.casefold)
     elif sort.startswith("desc"):
-        dct = dict(reversed(sorted(dct.items(), key=lambda x: x[0].casefold())))
-    elif sort != "none":
+        columns = sorted(columns, key=str.casefold)[::-1]
+    elif sort == "none":
+        columns = list(columns)
+    else:
         raise ValueError('"sort" should be "ascending", "descending" or "None".')
-    return dct
+    return columns
+
+
+def sort_column_names(dct: Mapping, sort: str):
+    if sort.lower() == "none":
+        return dct
+    return {column: dct[column] for column in sort_columns(dct, sort)}
+
+
+# Set in the worker processes of the describe pool by `_init_describe_1d_worker`
+_worker_summarizer: Any = None
+_worker_typeset: Any = None
+_worker_series: dict = {}
+
+
+def _init_describe_1d_worker(summarizer, typeset, series: dict) -> None:
+    """Store the summarizer, typeset and series in a worker process of the describe pool.
+
+    The workers are forked, so the arguments are inherited from the parent process rather than pickled. The
+    series values are shared with the parent (copy-on-write) and only the column names are sent to the workers.
+
+    Args:
+        summarizer: The summarizer used to describe the series.
+        typeset: The typeset used to infer the series types.
+        series: The series to describe, by column name.
+    """
+    global _worker_summarizer, _worker_typeset, _worker_series
+    _worker_summarizer = summarizer
+    _worker_typeset = typeset
+    _worker_series = series
+
+
+def _describe_1d_worker(column) -> Tuple[str, dict]:
+    """Describe a series in a worker process of the describe pool.
+
+    Args:
+        column: The name of the column.
+
+    Returns:
+        A tuple with column and the series description.
+    """
+    series = _worker_series[column]
+    return column, describe_1d(series, _worker_summarizer, _worker_typeset)
+
+
+def get_pool_size(pool_size_config) -> int:
+    """Get the number of workers of a pool.
+
+    Args:
+        pool_size_config: The pool_size setting, where 0 means one worker per CPU.
+
+    Returns:
+        The number of workers.
+    """
+    pool_size = pool_size_config.get(int)
+    if pool_size <= 0:
+        pool_size = multiprocessing.cpu_count()
+    return pool_size
+
+
+def use_process_pool() -> bool:
+    """Whether the workers of a pool are forked processes rather than threads, see the pool_backend setting.
+
+    Processes are only forked on Linux: forking is unsafe on macOS and not available on Windows.
+
+    Returns:
+        True if the workers are processes.
+    """
+    pool_backend = config["pool_backend"].get(str)
+    if pool_backend not in ("process", "thread"):
+        raise ValueError('"pool_backend" should be "process" or "thread".')
+    return pool_backend == "process" and sys.platform.startswith("linux")
+
+
+def _fork_pool(processes: int, initializer, initargs) -> multiprocessing.pool.Pool:
+    """Start a pool of forked worker processes.
+
+    A forked process only copies the calling thread, so the monitor thread of the progress bars is stopped
+    first: the workers must not inherit a lock held by it. tqdm starts it again for the next progress bar.
+
+    Args:
+        processes: The number of workers.
+        initializer: Called with `initargs` in each worker.
+        initargs: The arguments of `initializer`.
+
+    Returns:
+        The pool.
+    """
+    if tqdm.monitor is not None:
+        tqdm.monitor.exit()
+    return multiprocessing.get_context("fork").Pool(
+        processes, initializer=initializer, initargs=initargs
+    )
 
 
 def get_series_descriptions(df: GenericDataFrame, summarizer, typeset, pbar):
@@ -154,45 +267,122 @@ def get_series_descriptions(df: GenericDataFrame, summarizer, typeset, pbar):
 
     if isinstance(df, SparkDataFrame):
         # default spark pool_size is 5 to take advantage of multiple python processes running spark jobs
-        pool_size = config["spark"]["pool_size"].get(int)
+        pool_size = get_pool_size(config["spark"]["pool_size"])
     else:
-        pool_size = config["pool_size"].get(int)
+        pool_size = get_pool_size(config["pool_size"])
 
     sort = config["sort"].get(str)
-
-    # Multiprocessing of Describe 1D for each column
-    if pool_size <= 0:
-        pool_size = 1
+    process_pool = use_process_pool()
 
     args = [(name, series) for name, series in df.iteritems()]
 
+    if isinstance(df, PandasDataFrame) and config["optimize_memory"].get(bool):
+        # Every summary reads the series again, narrower integers make each pass cheaper
+        args = [
+            (name, PandasSeries(downcast_integers(series.series)))
+            for name, series in args
+        ]
+
     series_description = {}
 
-    if pool_size == 1:
+    # Reuse the descriptions of series that were described before with the same configuration
+    cache_keys = {}
+    if isinstance(df, PandasDataFrame) and config["describe_cache"].get(bool):
+        fingerprint = config_fingerprint()
+        for name, series in args:
+            cache_keys[name] = describe_cache.key(
+                series.series, summarizer, typeset, fingerprint
+            )
+            description = describe_cache.get(cache_keys[name])
+            if description is not None:
+                # the memory size includes the index, which is not part of the key
+                description["memory_size"] = series.series.memory_usage(
+                    deep=config["memory_deep"].get(bool)
+                )
+                series_description[name] = description
+                pbar.update()
+        args = [arg for arg in args if arg[0] not in series_description]
+
+    # Multiprocessing of Describe 1D for each column
+    if pool_size == 1 or len(args) <= 1:
         for arg in args:
             pbar.set_postfix_str(f"Describe variable:{arg[0]}")
             column, description = multiprocess_1d(arg)
             series_description[column] = description
             pbar.update()
     else:
-        # TODO: use `Pool` for Linux-based systems
-        with multiprocessing.pool.ThreadPool(pool_size) as executor:
+        pool_size = min(pool_size, len(args))
+        if isinstance(df, PandasDataFrame) and process_pool:
+            # describe_1d is bound by the GIL, so use processes where fork is available.
+            # The workers inherit the summarizer, typeset and series, only the column names are pickled.
+            executor = _fork_pool(
+                pool_size,
+                initializer=_init_describe_1d_worker,
+                initargs=(summarizer, typeset, dict(args)),
+            )
+            describe_func: Callable[[Any], Tuple[str, dict]] = _describe_1d_worker
+            tasks: List[Any] = [column for column, _ in args]
+        else:
+            # Spark jobs are submitted from threads, the work happens on the cluster
+            initializer: Optional[Callable[..., None]] = None
+            initargs: Tuple[Any, ...] = ()
+            scheduler_pool = (
+                config["spark"]["scheduler_pool"].get(str)
+                if isinstance(df, SparkDataFrame)
+                else ""
+            )
+            if scheduler_pool:
+                # With spark.scheduler.mode=FAIR the jobs of the threads share the executors in this pool,
+                # instead of queueing behind each other
+                spark_context = df.df.sql_ctx.sparkSession.sparkContext
+                initializer = spark_context.setLocalProperty
+                initargs = ("spark.scheduler.pool", scheduler_pool)
+            executor = multiprocessing.pool.ThreadPool(
+                pool_size, initializer=initializer, initargs=initargs
+            )
+            describe_func = multiprocess_1d
+            tasks = args
+
+        chunksize = max(1, len(args) // (pool_size * 4))
+        with executor:
             for i, (column, description) in enumerate(
-                executor.imap_unordered(multiprocess_1d, args)
+                executor.imap_unordered(describe_func, tasks, chunksize=chunksize)
             ):
                 pbar.set_postfix_str(f"Describe variable:{column}")
                 series_description[column] = description
                 pbar.update()
 
-        # Restore the original order
-        series_description = {k: series_description[k] for k in df.columns}
+    for column, _ in args:
+        describe_cache.put(cache_keys.get(column), series_description[column])
 
-    # Mapping from column name to variable type
-    series_description = sort_column_names(series_description, sort)
+    # Restore the original order and sort, building the mapping from column name to description once
+    series_description = {
+        column: series_description[column] for column in sort_columns(df.columns, sort)
+    }
 
     return series_description
 
 
+def has_unique_column(variable_stats: dict, columns: list) -> bool:
+    """Whether any of the columns has neither missing nor repeated values.
+
+    Rows can only be duplicates if they agree on every column, so such a column rules out duplicate rows without
+    having to compare the rows.
+
+    Args:
+        variable_stats: Previously calculated statistic on the DataFrame.
+        columns: The columns to consider.
+
+    Returns:
+        True if one of the columns is unique.
+    """
+    return any(
+        variable_stats[column].get("is_unique", False)
+        and variable_stats[column].get("n_missing", 1) == 0
+        for column in columns
+    )
+
+
 @singledispatch
 def get_table_stats(df: GenericDataFrame, variable_stats: dict) -> dict:
     """General statistics for the DataFrame.
@@ -210,90 +400,104 @@ def get_table_stats(df: GenericDataFrame, variable_stats: dict) -> dict:
     )
 
 
-@get_table_stats.register(PandasDataFrame)
-def _get_table_stats_pandas(df: PandasDataFrame, variable_stats: dict) -> dict:
-    n = len(df)
-
-    memory_size = df.get_memory_usage(deep=config["memory_deep"].get(bool))
-    record_size = float(memory_size) / n
+# Types that object columns are described as without being cast, their description holds the memory of the column
+_uncast_object_types = {Unsupported, Categorical, URL, Path, File, Image}
 
-    table_stats = {
-        "n": n,
-        "n_var": len(df.columns),
-        "memory_size": memory_size,
-        "record_size": record_size,
-        "n_cells_missing": 0,
-        "n_vars_with_missing": 0,
-        "n_vars_all_missing": 0,
-    }
 
-    for series_summary in variable_stats.values():
-        if "n_missing" in series_summary and series_summary["n_missing"] > 0:
-            table_stats["n_vars_with_missing"] += 1
-            table_stats["n_cells_missing"] += series_summary["n_missing"]
-            if series_summary["n_missing"] == n:
-                table_stats["n_vars_all_missing"] += 1
+def get_memory_usage_pandas(df: PandasDataFrame, variable_stats: dict) -> int:
+    """The memory usage of the DataFrame, reusing the deep memory usage of object columns from their descriptions.
 
-    table_stats["p_cells_missing"] = table_stats["n_cells_missing"] / (
-        table_stats["n"] * table_stats["n_var"]
-    )
+    Measuring the deep memory usage of object columns visits every value, describe_generic already did so for
+    the columns that were described as they are (not cast, and without missing values that were replaced by NaN).
 
-    supported_columns = [
-        k for k, v in variable_stats.items() if v["type"] != Unsupported
-    ]
-    table_stats["n_duplicates"] = (
-        df.get_duplicate_rows_count(subset=supported_columns)
-        if len(supported_columns) > 0
-        else 0
-    )
-    table_stats["p_duplicates"] = (
-        (table_stats["n_duplicates"] / len(df))
-        if (len(supported_columns) > 0 and len(df) > 0)
-        else 0
-    )
+    Args:
+        df: The DataFrame.
+        variable_stats: The descriptions of the columns.
 
-    # Variable type counts
-    table_stats.update(
-        {"types": dict(Counter([v["type"] for v in variable_stats.values()]))}
-    )
+    Returns:
+        The memory usage in bytes, including the index.
+    """
+    deep = config["memory_deep"].get(bool)
+    if not deep:
+        return df.get_memory_usage(deep=False)
+
+    # the memory usage of a described series includes its index
+    index_memory = df.df.index.memory_usage(deep=True)
+    memory_size = index_memory
+    for column, series in df.df.items():
+        description = variable_stats.get(column, {})
+        if (
+            series.dtype == object
+            and description.get("type") in _uncast_object_types
+            and description.get("n_missing") == 0
+            and "memory_size" in description
+        ):
+            memory_size += description["memory_size"] - index_memory
+        else:
+            memory_size += series.memory_usage(deep=True, index=False)
+    return memory_size
+
+
+def _get_table_stats(
+    df: GenericDataFrame, variable_stats: dict, unsupported_type, memory_size=None
+) -> dict:
+    """General statistics for the DataFrame, shared by the backends.
 
-    return table_stats
+    The statistics on missing values are reduced over an array of the missing counts per column, the supported
+    columns and the type counts are tallied in a single pass over the variable descriptions.
 
+    Args:
+      df: The DataFrame to describe.
+      variable_stats: Previously calculated statistic on the DataFrame.
+      unsupported_type: The unsupported type of the backend.
+      memory_size: The memory usage of the DataFrame, computed from the DataFrame if not given.
 
-@get_table_stats.register(SparkDataFrame)
-def _get_table_stats_spark(df: SparkDataFrame, variable_stats: dict) -> dict:
+    Returns:
+        A dictionary that contains the table statistics.
+    """
     n = len(df)
 
-    memory_size = df.get_memory_usage(deep=config["memory_deep"].get(bool))
+    if memory_size is None:
+        memory_size = df.get_memory_usage(deep=config["memory_deep"].get(bool))
     record_size = float(memory_size) / n
 
+    n_missing = np.fromiter(
+        (
+            series_summary.get("n_missing", 0)
+            for series_summary in variable_stats.values()
+        ),
+        dtype=np.int64,
+        count=len(variable_stats),
+    )
+
     table_stats = {
         "n": n,
         "n_var": len(df.columns),
         "memory_size": memory_size,
         "record_size": record_size,
-        "n_cells_missing": 0,
-        "n_vars_with_missing": 0,
-        "n_vars_all_missing": 0,
+        "n_cells_missing": int(n_missing.sum()),
+        "n_vars_with_missing": int(np.count_nonzero(n_missing)),
+        "n_vars_all_missing": int(np.count_nonzero(n_missing == n)) if n > 0 else 0,
     }
 
-    for series_summary in variable_stats.values():
-        if "n_missing" in series_summary and series_summary["n_missing"] > 0:
-            table_stats["n_vars_with_missing"] += 1
-            table_stats["n_cells_missing"] += series_summary["n_missing"]
-            if series_summary["n_missing"] == n:
-                table_stats["n_vars_all_missing"] += 1
+    supported_columns = []
+    type_counts: dict = {}
+    for column, series_summary in variable_stats.items():
+        if series_summary["type"] != unsupported_type:
+            supported_columns.append(column)
+
+        type_counts[series_summary["type"]] = (
+            type_counts.get(series_summary["type"], 0) + 1
+        )
 
     table_stats["p_cells_missing"] = table_stats["n_cells_missing"] / (
         table_stats["n"] * table_stats["n_var"]
     )
 
-    supported_columns = [
-        k for k, v in variable_stats.items() if v["type"] != SparkUnsupported
-    ]
     table_stats["n_duplicates"] = (
         df.get_duplicate_rows_count(subset=supported_columns)
         if len(supported_columns) > 0
+        and not has_unique_column(variable_stats, supported_columns)
         else 0
     )
     table_stats["p_duplicates"] = (
@@ -303,13 +507,23 @@ def _get_table_stats_spark(df: SparkDataFrame, variable_stats: dict) -> dict:
     )
 
     # Variable type counts
-    table_stats.update(
-        {"types": dict(Counter([v["type"] for v in variable_stats.values()]))}
-    )
+    table_stats.update({"types": type_counts})
 
     return table_stats
 
 
+@get_table_stats.register(PandasDataFrame)
+def _get_table_stats_pandas(df: PandasDataFrame, variable_stats: dict) -> dict:
+    return _get_table_stats(
+        df, variable_stats, Unsupported, get_memory_usage_pandas(df, variable_stats)
+    )
+
+
+@get_table_stats.register(SparkDataFrame)
+def _get_table_stats_spark(df: SparkDataFrame, variable_stats: dict) -> dict:
+    return _get_table_stats(df, variable_stats, SparkUnsupported)
+
+
 @singledispatch
 def get_missing_diagrams(df: GenericDataFrame, table_stats: dict) -> dict:
     """Gets the rendered diagrams for missing values.
@@ -327,139 +541,181 @@ def get_missing_diagrams(df: GenericDataFrame, table_stats: dict) -> dict:
     )
 
 
-@get_missing_diagrams.register(PandasDataFrame)
-def _get_missing_diagrams_pandas(df: PandasDataFrame, table_stats: dict) -> dict:
-    def warn_missing(missing_name, error):
-        warnings.warn(
-            f"""There was an attempt to generate the {missing_name} missing values diagrams, but this failed.
+def get_nullity_frame(df: PandasDataFrame) -> PandasDataFrame:
+    """A float frame with the columns of the DataFrame that is missing (NaN) where the DataFrame is missing.
+
+    The missing values diagrams only depend on the nullity of the values and each one detects the missing values
+    again (the heatmap even twice). Detecting them in object columns is an element-wise pass in Python, so the
+    nullity is computed once and the diagrams detect it again on this frame, which is a vectorized pass.
+
+    Args:
+        df: The DataFrame on which to calculate the missing values.
+
+    Returns:
+        The nullity frame.
+    """
+    pandas_df = df.get_pandas_df()
+    nullity = np.where(pandas_df.isna().to_numpy(), np.float32(np.nan), np.float32(1))
+    return PandasDataFrame(
+        pd.DataFrame(nullity, index=pandas_df.index, columns=pandas_df.columns)
+    )
+
+
+_missing_diagrams = {
+    "bar": {
+        "min_missing": 0,
+        "name": "Count",
+        "caption": "A simple visualization of nullity by column.",
+    },
+    "matrix": {
+        "min_missing": 0,
+        "name": "Matrix",
+        "caption": "Nullity matrix is a data-dense display which lets you quickly visually pick out patterns in data completion.",
+    },
+    "heatmap": {
+        "min_missing": 2,
+        "name": "Heatmap",
+        "caption": "The correlation heatmap measures nullity correlation: how strongly the presence or absence of one variable affects the presence of another.",
+    },
+    "dendrogram": {
+        "min_missing": 1,
+        "name": "Dendrogram",
+        "caption": "The dendrogram allows you to more fully correlate variable completion, revealing trends deeper than the pairwise ones visible in the correlation heatmap.",
+    },
+}
+
+
+def _warn_missing(missing_name: str, error: Exception) -> None:
+    warnings.warn(
+        f"""There was an attempt to generate the {missing_name} missing values diagrams, but this failed.
     To hide this warning, disable the calculation
     (using `df.profile_report(missing_diagrams={{"{missing_name}": False}}`)
     If this is problematic for your use case, please report this as an issue:
     https://github.com/pandas-profiling/pandas-profiling/issues
     (include the error message: '{error}')"""
-        )
+    )
 
-    def missing_diagram(name) -> Callable:
-        return {
-            "bar": missing_bar,
-            "matrix": missing_matrix,
-            "heatmap": missing_heatmap,
-            "dendrogram": missing_dendrogram,
-        }[name]
-
-    missing_map = {
-        "bar": {
-            "min_missing": 0,
-            "name": "Count",
-            "caption": "A simple visualization of nullity by column.",
-        },
-        "matrix": {
-            "min_missing": 0,
-            "name": "Matrix",
-            "caption": "Nullity matrix is a data-dense display which lets you quickly visually pick out patterns in data completion.",
-        },
-        "heatmap": {
-            "min_missing": 2,
-            "name": "Heatmap",
-            "caption": "The correlation heatmap measures nullity correlation: how strongly the presence or absence of one variable affects the presence of another.",
-        },
-        "dendrogram": {
-            "min_missing": 1,
-            "name": "Dendrogram",
-            "caption": "The dendrogram allows you to more fully correlate variable completion, revealing trends deeper than the pairwise ones visible in the correlation heatmap.",
-        },
-    }
 
-    missing_map = {
-        name: settings
-        for name, settings in missing_map.items()
-        if config["missing_diagrams"][name].get(bool)
-        and table_stats["n_vars_with_missing"] >= settings["min_missing"]
-    }
-    missing = {}
-
-    if len(missing_map) > 0:
-        for name, settings in missing_map.items():
-            try:
-                if name != "heatmap" or (
-                    table_stats["n_vars_with_missing"]
-                    - table_stats["n_vars_all_missing"]
-                    >= settings["min_missing"]
-                ):
-                    missing[name] = {
-                        "name": settings["name"],
-                        "caption": settings["caption"],
-                        "matrix": missing_diagram(name)(df),
-                    }
-            except ValueError as e:
-                warn_missing(name, e)
+# Set in the worker processes of the missing diagrams pool by `_init_missing_worker`
+_worker_missing_df: Any = None
 
-    return missing
 
+def _init_missing_worker(df: GenericDataFrame) -> None:
+    """Store the DataFrame in a worker process of the missing diagrams pool.
 
-@get_missing_diagrams.register(SparkDataFrame)
-def _get_missing_diagrams_spark(df: SparkDataFrame, table_stats: dict) -> dict:
+    Args:
+        df: The DataFrame on which to calculate the missing values.
     """
-    awaiting missingno submission
+    global _worker_missing_df
+    _worker_missing_df = df
+
+
+def _missing_worker(name: str) -> Tuple[str, Optional[str], Optional[ValueError]]:
+    """Render a missing values diagram in a worker process of the missing diagrams pool.
 
     Args:
-        df:
-        table_stats:
+        name: The name of the diagram.
 
     Returns:
-
+        A tuple with the name, the plot and the error raised while rendering (if any).
     """
+    return _render_missing_diagram(_worker_missing_df, name)
 
-    def warn_missing(missing_name, error):
-        warnings.warn(
-            f"""There was an attempt to generate the {missing_name} missing values diagrams, but this failed.
-    To hide this warning, disable the calculation
-    (using `df.profile_report(missing_diagrams={{"{missing_name}": False}}`)
-    If this is problematic for your use case, please report this as an issue:
-    https://github.com/pandas-profiling/pandas-profiling/issues
-    (include the error message: '{error}')"""
-        )
 
-    def missing_diagram(name) -> Callable:
-        return {
-            "bar": missing_bar,
-        }[name]
-
-    missing_map = {
-        "bar": {
-            "min_missing": 0,
-            "name": "Count",
-            "caption": "A simple visualization of nullity by column.",
-        },
-    }
+def _render_missing_diagram(
+    df: GenericDataFrame, name: str
+) -> Tuple[str, Optional[str], Optional[ValueError]]:
+    # imported when a diagram is requested, importing missingno is slow
+    from pandas_profiling.visualisation import missing as missing_plots
+
+    try:
+        return name, getattr(missing_plots, f"missing_{name}")(df), None
+    except ValueError as e:
+        return name, None, e
+
+
+def _get_missing_diagrams(
+    df: GenericDataFrame,
+    table_stats: dict,
+    names: list,
+    prepare: Optional[Callable] = None,
+) -> dict:
+    """Render the missing values diagrams of a backend, shared by the backends.
+
+    Args:
+        df: The DataFrame on which to calculate the missing values.
+        table_stats: The overall statistics for the DataFrame.
+        names: The diagrams the backend supports.
+        prepare: Applied to the DataFrame once before rendering, when any diagram is rendered.
 
-    missing_map = {
-        name: settings
-        for name, settings in missing_map.items()
+    Returns:
+        A dictionary containing the base64 encoded plots for each diagram that is active in the config.
+    """
+    names = [
+        name
+        for name in names
         if config["missing_diagrams"][name].get(bool)
-        and table_stats["n_vars_with_missing"] >= settings["min_missing"]
-    }
-    missing = {}
-
-    if len(missing_map) > 0:
-        for name, settings in missing_map.items():
-            try:
-                if name != "heatmap" or (
-                    table_stats["n_vars_with_missing"]
-                    - table_stats["n_vars_all_missing"]
-                    >= settings["min_missing"]
-                ):
-                    missing[name] = {
-                        "name": settings["name"],
-                        "caption": settings["caption"],
-                        "matrix": missing_diagram(name)(df),
-                    }
-            except ValueError as e:
-                warn_missing(name, e)
+        and table_stats["n_vars_with_missing"] >= _missing_diagrams[name]["min_missing"]
+        and (
+            name != "heatmap"
+            or table_stats["n_vars_with_missing"] - table_stats["n_vars_all_missing"]
+            >= _missing_diagrams[name]["min_missing"]
+        )
+    ]
+    missing: dict = {}
+    if len(names) == 0:
+        return missing
+
+    if prepare is not None:
+        df = prepare(df)
+
+    pool_size = get_pool_size(config["pool_size"])
+    if (
+        isinstance(df, PandasDataFrame)
+        and pool_size > 1
+        and len(names) > 1
+        and use_process_pool()
+    ):
+        # The diagrams are independent, draw them in forked processes that inherit the DataFrame
+        executor = _fork_pool(
+            min(pool_size, len(names)),
+            initializer=_init_missing_worker,
+            initargs=(df,),
+        )
+        with executor:
+            results = executor.map(_missing_worker, names)
+    else:
+        results = [_render_missing_diagram(df, name) for name in names]
+
+    for name, plot, error in results:
+        if error is not None:
+            _warn_missing(name, error)
+        else:
+            missing[name] = {
+                "name": _missing_diagrams[name]["name"],
+                "caption": _missing_diagrams[name]["caption"],
+                "matrix": plot,
+            }
 
     return missing
 
 
+@get_missing_diagrams.register(PandasDataFrame)
+def _get_missing_diagrams_pandas(df: PandasDataFrame, table_stats: dict) -> dict:
+    return _get_missing_diagrams(
+        df,
+        table_stats,
+        ["bar", "matrix", "heatmap", "dendrogram"],
+        prepare=get_nullity_frame,
+    )
+
+
+@get_missing_diagrams.register(SparkDataFrame)
+def _get_missing_diagrams_spark(df: SparkDataFrame, table_stats: dict) -> dict:
+    # awaiting missingno submission, only the bar diagram is supported for spark
+    return _get_missing_diagrams(df, table_stats, ["bar"])
+
+
 @singledispatch
 def get_scatter_matrix(df, continuous_variables):
     data_type = type(df)
@@ -468,6 +724,41 @@ def get_scatter_matrix(df, continuous_variables):
     )
 
 
+# Set in the worker processes of the scatter pool by `_init_scatter_worker`
+_worker_scatter_columns: dict = {}
+_worker_scatter_notna: dict = {}
+
+
+def _init_scatter_worker(columns: dict, notna: dict) -> None:
+    """Store the continuous columns in a worker process of the scatter pool.
+
+    Args:
+        columns: The continuous series, by column name.
+        notna: The masks of the values that are not missing, by column name.
+    """
+    global _worker_scatter_columns, _worker_scatter_notna
+    _worker_scatter_columns = columns
+    _worker_scatter_notna = notna
+
+
+def _scatter_worker(pair: Tuple[str, str]) -> Tuple[str, str, str]:
+    """Plot a pair of columns in a worker process of the scatter pool.
+
+    Args:
+        pair: The names of the columns on the x- and y-axis.
+
+    Returns:
+        A tuple with the column names and the plot.
+    """
+    x, y = pair
+    return x, y, _scatter_pair(_worker_scatter_columns, _worker_scatter_notna, x, y)
+
+
+def _scatter_pair(columns: dict, notna: dict, x: str, y: str) -> str:
+    indices = notna[x] & notna[y]
+    return scatter_pairwise(columns[x][indices], columns[y][indices], x, y)
+
+
 @get_scatter_matrix.register(PandasDataFrame)
 def _get_scatter_matrix_pandas(df, continuous_variables):
     scatter_matrix = {}
@@ -478,13 +769,31 @@ def _get_scatter_matrix_pandas(df, continuous_variables):
 
         scatter_matrix = {x: {y: "" for y in continuous_variables} for x in targets}
 
-        for x in targets:
-            for y in continuous_variables:
-                if x in continuous_variables:
-                    subset_df = df.dropna(subset=[x, y])
-                    scatter_matrix[x][y] = scatter_pairwise(
-                        subset_df[x], subset_df[y], x, y
-                    )
+        pairs = [
+            (x, y)
+            for x in targets
+            if x in continuous_variables
+            for y in continuous_variables
+        ]
+
+        # Compute the missing values once, rather than dropping them from the whole DataFrame for each pair
+        columns = {column: df[column] for column in continuous_variables}
+        notna = {column: columns[column].notna().values for column in columns}
+
+        pool_size = get_pool_size(config["pool_size"])
+        if pool_size > 1 and len(pairs) > 1 and use_process_pool():
+            # Matplotlib is not thread-safe, so the plots are drawn in forked processes that inherit the columns
+            executor = _fork_pool(
+                min(pool_size, len(pairs)),
+                initializer=_init_scatter_worker,
+                initargs=(columns, notna),
+            )
+            with executor:
+                for x, y, plot in executor.imap_unordered(_scatter_worker, pairs):
+                    scatter_matrix[x][y] = plot
+        else:
+            for x, y in pairs:
+                scatter_matrix[x][y] = _scatter_pair(columns, notna, x, y)
 
     return scatter_matrix
 
@@ -501,18 +810,31 @@ def _get_scatter_matrix_spark(df, continuous_variables):
 
         df.persist()
 
+        # (x, y) and (y, x) share their counts, only the axes of the plots differ
+        pair_counts = {}
         for x in targets:
+            if x not in continuous_variables:
+                continue
+
             for y in continuous_variables:
-                if x in continuous_variables:
-                    scatter_matrix[x][y] = spark_scatter_pairwise(df, x, y)
+                pair = frozenset((x, y))
+                if pair not in pair_counts:
+                    pair_counts[pair] = spark_scatter_counts(df, x, y)
+                scatter_matrix[x][y] = spark_scatter_pairwise(
+                    df, x, y, pair_counts[pair]
+                )
 
     return scatter_matrix
 
 
 def get_messages(table_stats, series_description, correlations):
     messages = check_table_messages(table_stats)
-    for col, description in series_description.items():
-        messages += check_variable_messages(col, description)
+    messages.extend(
+        itertools.chain.from_iterable(
+            check_variable_messages(col, description)
+            for col, description in series_description.items()
+        )
+    )
     messages += check_correlation_messages(correlations)
     messages.sort(key=lambda message: str(message.message_type))
     return messages
@@ -1,19 +1,21 @@
 import functools
+import re
 from typing import Tuple
-from urllib.parse import urlsplit
 
 import numpy as np
 import pandas as pd
 from pandas.core.arrays.integer import _IntegerDtype
-from visions.utils import func_nullable_series_contains
 
 from pandas_profiling.config import config
-from pandas_profiling.model.series_wrappers import SparkSeries
+from pandas_profiling.model.series_wrappers import SparkSeries, spark_to_pandas
 from pandas_profiling.model.summary_helpers import (
+    URL_PATTERN,
+    boolean_value_counts,
     chi_square,
     file_summary,
     histogram_compute,
     image_summary,
+    integer_value_counts,
     length_summary,
     mad,
     path_summary,
@@ -31,12 +33,22 @@ def describe_counts(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]:
     Returns:
         A dictionary with the count values (with and without NaN, distinct).
     """
-    try:
-        value_counts_with_nan = series.value_counts(dropna=False)
-        _ = set(value_counts_with_nan.index)
+    # numpy integer and boolean series can neither be missing nor unhashable, count them without hashing
+    if isinstance(series.dtype, np.dtype) and series.dtype.kind in "biu":
+        value_counts_with_nan = integer_value_counts(series)
+    elif isinstance(series.dtype, pd.BooleanDtype):
+        value_counts_with_nan = boolean_value_counts(series)
+    else:
+        value_counts_with_nan = None
+    if value_counts_with_nan is not None:
         hashable = True
-    except:
-        hashable = False
+    else:
+        try:
+            value_counts_with_nan = series.value_counts(dropna=False)
+            _ = set(value_counts_with_nan.index)
+            hashable = True
+        except:
+            hashable = False
 
     summary["hashable"] = hashable
 
@@ -74,6 +86,21 @@ def series_hashable(fn):
     return inner
 
 
+def series_handle_nulls(fn):
+    """Drop the missing values of the series, which describe_counts already counted, so that the series does
+    not have to be scanned for them."""
+
+    @functools.wraps(fn)
+    def inner(series, summary):
+        if summary["n_missing"] > 0:
+            series = series.dropna()
+            if series.empty:
+                return False
+        return fn(series, summary)
+
+    return inner
+
+
 @series_hashable
 def describe_supported(
     series: pd.Series, series_description: dict
@@ -91,7 +118,7 @@ def describe_supported(
 
     value_counts = series_description["value_counts_without_nan"]
     distinct_count = len(value_counts)
-    unique_count = value_counts.where(value_counts == 1).count()
+    unique_count = np.count_nonzero(value_counts.values == 1)
 
     stats = {
         "n_distinct": distinct_count,
@@ -122,83 +149,142 @@ def describe_generic(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]
             "n": length,
             "p_missing": summary["n_missing"] / length,
             "count": length - summary["n_missing"],
-            "memory_size": series.memory_usage(deep=config["memory_deep"].get(bool)),
+            "memory_size": series.memory_usage(deep=config.snapshot()["memory_deep"]),
         }
     )
 
     return series, summary
 
 
-def numeric_stats_pandas(series: pd.Series):
-    #     summary["min"] = summary["value_counts_without_nan"].index.min()
-    # vc.index.min()
+def _zero_out_fperr(value: float) -> float:
+    # Treat floating point noise as zero, consistent with pandas' skew and kurt
+    return 0.0 if np.abs(value) < 1e-14 else value
+
+
+def numeric_moments(values: np.ndarray) -> dict:
+    """Compute the sum, mean, variance, skewness and kurtosis from shared central moments.
+
+    The deviations from the mean are computed once and reused for all moments, rather than re-reading the array
+    for each statistic. The results are identical to those of the corresponding pandas methods.
+
+    Args:
+        values: the values without missing values.
+
+    Returns:
+        A dict with the sum, mean, std, variance, kurtosis and skewness.
+    """
+    count = len(values)
+    total = values.sum(dtype=np.float64) if values.dtype.kind == "f" else values.sum()
+    if count == 0:
+        return {
+            "mean": np.nan,
+            "std": np.nan,
+            "variance": np.nan,
+            "kurtosis": np.nan,
+            "skewness": np.nan,
+            "sum": total,
+        }
+
+    with np.errstate(invalid="ignore", over="ignore"):
+        # the sum of large integers wraps around in their own dtype
+        mean = values.mean(dtype=np.float64)
+        # float32 values minus a scalar mean stay float32, accumulate the moments in float64
+        deviations = np.subtract(values, mean, dtype=np.float64)
+        squared_deviations = deviations * deviations
+        m2 = squared_deviations.sum(dtype=np.float64)
+        m3 = np.dot(squared_deviations, deviations)
+        m4 = np.dot(squared_deviations, squared_deviations)
+
+    variance = m2 / (count - 1) if count > 1 else np.nan
+
+    # Unbiased skew normalized by N-1
+    m2 = _zero_out_fperr(m2)
+    if count < 3:
+        skewness = np.nan
+    elif m2 == 0:
+        skewness = 0
+    else:
+        with np.errstate(invalid="ignore", divide="ignore"):
+            skewness = (count * (count - 1) ** 0.5 / (count - 2)) * (
+                _zero_out_fperr(m3) / m2 ** 1.5
+            )
+
+    # Unbiased kurtosis obtained using Fisher's definition (kurtosis of normal == 0.0). Normalized by N-1.
+    if count < 4:
+        kurtosis = np.nan
+    else:
+        with np.errstate(invalid="ignore", divide="ignore", over="ignore"):
+            adj = 3 * (count - 1) ** 2 / ((count - 2) * (count - 3))
+            numer = _zero_out_fperr(count * (count + 1) * (count - 1) * m4)
+            denom = _zero_out_fperr((count - 2) * (count - 3) * m2 ** 2)
+            kurtosis = 0 if denom == 0 else numer / denom - adj
+
     return {
-        "mean": series.mean(),
-        "std": series.std(),
-        "variance": series.var(),
-        "min": series.min(),
-        "max": series.max(),
-        # Unbiased kurtosis obtained using Fisher's definition (kurtosis of normal == 0.0). Normalized by N-1.
-        "kurtosis": series.kurt(),
-        # Unbiased skew normalized by N-1
-        "skewness": series.skew(),
-        "sum": series.sum(),
+        "mean": mean,
+        "std": np.sqrt(variance),
+        "variance": variance,
+        "kurtosis": kurtosis,
+        "skewness": skewness,
+        "sum": total,
     }
 
 
 def numeric_stats_numpy(present_values, series, series_description):
     vc = series_description["value_counts_without_nan"]
     index_values = vc.index.values
-    return {
-        "mean": np.mean(present_values),
-        "std": np.std(present_values, ddof=1),
-        "variance": np.var(present_values, ddof=1),
-        "min": np.min(index_values),
-        "max": np.max(index_values),
-        # Unbiased kurtosis obtained using Fisher's definition (kurtosis of normal == 0.0). Normalized by N-1.
-        "kurtosis": series.kurt(),
-        # Unbiased skew normalized by N-1
-        "skewness": series.skew(),
-        "sum": np.sum(present_values),
-    }
+    stats = numeric_moments(present_values)
+    stats.update(
+        {
+            "min": np.min(index_values),
+            "max": np.max(index_values),
+        }
+    )
+    return stats
 
 
 def numeric_stats_spark(series: SparkSeries):
     import pyspark.sql.functions as F
 
-    numeric_results_df = (
-        series.dropna.select(
-            F.mean(series.name).alias("mean"),
-            F.stddev(series.name).alias("std"),
-            F.variance(series.name).alias("variance"),
-            F.min(series.name).alias("min"),
-            F.max(series.name).alias("max"),
-            F.kurtosis(series.name).alias("kurtosis"),
-            F.skewness(series.name).alias("skewness"),
-            F.sum(series.name).alias("sum"),
-        )
-        .toPandas()
-        .T
-    )
-
+    column = F.col(series.name)
+    # All statistics in a single aggregation, which spark computes in one scan of the series
+    numeric_results = series.dropna.select(
+        F.mean(column).alias("mean"),
+        F.stddev(column).alias("std"),
+        F.variance(column).alias("variance"),
+        F.min(column).alias("min"),
+        F.max(column).alias("max"),
+        F.kurtosis(column).alias("kurtosis"),
+        F.skewness(column).alias("skewness"),
+        F.sum(column).alias("sum"),
+        F.sum(column.isin([np.inf, -np.inf]).cast("long")).alias("n_infinite"),
+        F.sum((column == 0).cast("long")).alias("n_zeros"),
+    ).first()
+
+    # as when collected with toPandas, the statistics of no values are NaN
+    # the kurtosis is unbiased and uses Fisher's definition (kurtosis of normal == 0.0), normalized by N-1
+    # the skewness is unbiased, normalized by N-1
     results = {
-        "mean": numeric_results_df.loc["mean"][0],
-        "std": numeric_results_df.loc["std"][0],
-        "variance": numeric_results_df.loc["variance"][0],
-        "min": numeric_results_df.loc["min"][0],
-        "max": numeric_results_df.loc["max"][0],
-        # Unbiased kurtosis obtained using Fisher's definition (kurtosis of normal == 0.0). Normalized by N-1.
-        "kurtosis": numeric_results_df.loc["kurtosis"][0],
-        # Unbiased skew normalized by N-1
-        "skewness": numeric_results_df.loc["skewness"][0],
-        "sum": numeric_results_df.loc["sum"][0],
+        key: np.nan if numeric_results[key] is None else numeric_results[key]
+        for key in [
+            "mean",
+            "std",
+            "variance",
+            "min",
+            "max",
+            "kurtosis",
+            "skewness",
+            "sum",
+        ]
     }
+    # the sums are null when there are no values
+    results["n_infinite"] = numeric_results["n_infinite"] or 0
+    results["n_zeros"] = numeric_results["n_zeros"] or 0
 
     return results
 
 
 @series_hashable
-@func_nullable_series_contains
+@series_handle_nulls
 def describe_numeric_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]:
     """Describe a numeric series.
     Args:
@@ -209,16 +295,21 @@ def describe_numeric_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, di
     """
 
     # Config
-    chi_squared_threshold = config["vars"]["num"]["chi_squared_threshold"].get(float)
-    quantiles = config["vars"]["num"]["quantiles"].get(list)
+    num_config = config.snapshot()["vars"]["num"]
+    chi_squared_threshold = float(num_config["chi_squared_threshold"])
+    quantiles = num_config["quantiles"]
 
     value_counts = summary["value_counts_without_nan"]
 
     summary["n_zeros"] = 0
 
-    infinity_values = [np.inf, -np.inf]
-    infinity_index = value_counts.index.isin(infinity_values)
-    summary["n_infinite"] = value_counts.loc[infinity_index].sum()
+    index_values = value_counts.index.values
+    if index_values.dtype.kind == "f":
+        infinity_index = np.isinf(index_values)
+    else:
+        # Integers cannot be infinite
+        infinity_index = np.zeros(len(index_values), dtype=bool)
+    summary["n_infinite"] = value_counts.values[infinity_index].sum()
 
     if 0 in value_counts.index:
         summary["n_zeros"] = value_counts.loc[0]
@@ -226,13 +317,24 @@ def describe_numeric_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, di
     stats = summary
 
     if isinstance(series.dtype, _IntegerDtype):
-        stats.update(numeric_stats_pandas(series))
-        present_values = series.astype(str(series.dtype).lower())
+        present_values = series.to_numpy(dtype=str(series.dtype).lower())
         finite_values = present_values
+        # to_numpy copied the values
+        owns_values = True
     else:
         present_values = series.values
-        finite_values = present_values[np.isfinite(present_values)]
-        stats.update(numeric_stats_numpy(present_values, series, summary))
+        owns_values = False
+        if summary["n_infinite"] > 0:
+            finite_values = present_values[np.isfinite(present_values)]
+        else:
+            finite_values = present_values
+    stats.update(numeric_stats_numpy(present_values, series, summary))
+
+    # A constant series has the same value at every quantile and is monotonic, its first value gives the same
+    # quantiles and median absolute deviation without partitioning the whole series
+    is_constant = bool(summary["n_distinct"] == 1 and summary["n_infinite"] == 0)
+    if is_constant:
+        present_values = present_values[:1]
 
     stats.update(
         {
@@ -241,13 +343,24 @@ def describe_numeric_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, di
     )
 
     if chi_squared_threshold > 0.0:
-        stats["chi_squared"] = chi_square(finite_values)
+        if stats["n_infinite"] == 0:
+            stats["chi_squared"] = chi_square(
+                finite_values, lo=stats["min"], hi=stats["max"]
+            )
+        else:
+            stats["chi_squared"] = chi_square(finite_values)
 
     stats["range"] = stats["max"] - stats["min"]
+    # All quantiles are selected from the values in a single partition, in place when the values are a copy
+    quantile_values = np.quantile(
+        np.asarray(present_values),
+        quantiles,
+        overwrite_input=owns_values,
+    )
     stats.update(
         {
             f"{percentile:.0%}": value
-            for percentile, value in series.quantile(quantiles).to_dict().items()
+            for percentile, value in zip(quantiles, quantile_values)
         }
     )
     stats["iqr"] = stats["75%"] - stats["25%"]
@@ -255,21 +368,20 @@ def describe_numeric_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, di
     stats["p_zeros"] = stats["n_zeros"] / summary["n"]
     stats["p_infinite"] = summary["n_infinite"] / summary["n"]
 
-    stats["monotonic_increase"] = series.is_monotonic_increasing
-    stats["monotonic_decrease"] = series.is_monotonic_decreasing
+    stats["monotonic_increase"] = is_constant or series.is_monotonic_increasing
+    stats["monotonic_decrease"] = is_constant or series.is_monotonic_decreasing
 
-    stats["monotonic_increase_strict"] = (
-        stats["monotonic_increase"] and series.is_unique
-    )
-    stats["monotonic_decrease_strict"] = (
-        stats["monotonic_decrease"] and series.is_unique
-    )
+    # The series holds no missing values, so it is unique when every value is distinct (without hashing it again)
+    is_unique = summary["n_distinct"] == len(series)
+    stats["monotonic_increase_strict"] = stats["monotonic_increase"] and is_unique
+    stats["monotonic_decrease_strict"] = stats["monotonic_decrease"] and is_unique
 
     stats.update(
         histogram_compute(
-            value_counts[~infinity_index].index.values,
+            index_values[~infinity_index],
             summary["n_distinct"],
-            weights=value_counts[~infinity_index].values,
+            weights=value_counts.values[~infinity_index],
+            iqr=stats["iqr"],
         )
     )
 
@@ -277,7 +389,7 @@ def describe_numeric_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, di
 
 
 @series_hashable
-@func_nullable_series_contains
+@series_handle_nulls
 def describe_date_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]:
     """Describe a date series.
 
@@ -288,18 +400,23 @@ def describe_date_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]
     Returns:
         A dict containing calculated series description values.
     """
-    chi_squared_threshold = config["vars"]["num"]["chi_squared_threshold"].get(float)
+    chi_squared_threshold = float(
+        config.snapshot()["vars"]["num"]["chi_squared_threshold"]
+    )
 
+    # The missing values were dropped, so the dates are reduced as nanoseconds since the epoch (in UTC)
+    nanoseconds = series.values.view(np.int64)
+    tz = getattr(series.dtype, "tz", None)
     summary.update(
         {
-            "min": pd.Timestamp.to_pydatetime(series.min()),
-            "max": pd.Timestamp.to_pydatetime(series.max()),
+            "min": pd.Timestamp(nanoseconds.min(), tz=tz).to_pydatetime(),
+            "max": pd.Timestamp(nanoseconds.max(), tz=tz).to_pydatetime(),
         }
     )
 
     summary["range"] = summary["max"] - summary["min"]
 
-    values = series.values.astype(np.int64) // 10 ** 9
+    values = nanoseconds // 10 ** 9
 
     if chi_squared_threshold > 0.0:
         summary["chi_squared"] = chi_square(values)
@@ -309,7 +426,7 @@ def describe_date_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]
 
 
 @series_hashable
-@func_nullable_series_contains
+@series_handle_nulls
 def describe_categorical_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]:
     """Describe a categorical series.
 
@@ -320,13 +437,16 @@ def describe_categorical_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series
     Returns:
         A dict containing calculated series description values.
     """
-    chi_squared_threshold = config["vars"]["num"]["chi_squared_threshold"].get(float)
-    check_length = config["vars"]["cat"]["length"].get(bool)
-    check_unicode = config["vars"]["cat"]["unicode"].get(bool)
+    vars_config = config.snapshot()["vars"]
+    chi_squared_threshold = float(vars_config["num"]["chi_squared_threshold"])
+    check_length = vars_config["cat"]["length"]
+    check_unicode = vars_config["cat"]["unicode"]
     # coerce_str_to_date = config["vars"]["cat"]["coerce_str_to_date"].get(bool)
 
     # Make sure we deal with strings (Issue #100)
-    series = series.astype(str)
+    # Skip the copy when the values already are strings
+    if series.dtype != object or pd.api.types.infer_dtype(series) != "string":
+        series = series.astype(str)
 
     # Only run if at least 1 non-missing value
     value_counts = summary["value_counts_without_nan"]
@@ -342,10 +462,15 @@ def describe_categorical_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series
 
     if check_length:
         summary.update(length_summary(series))
+        length = summary["length"].values
+        # Lengths are small non-negative integers, counting them is cheaper than hashing,
+        # unless a few long values would make the counts much longer than the series
+        if length.max(initial=0) <= max(2 * len(length), 1024):
+            n_unique_length = np.count_nonzero(np.bincount(length))
+        else:
+            n_unique_length = pd.Series(length).nunique()
         summary.update(
-            histogram_compute(
-                summary["length"], summary["length"].nunique(), name="histogram_length"
-            )
+            histogram_compute(length, n_unique_length, name="histogram_length")
         )
 
     if check_unicode:
@@ -372,11 +497,19 @@ def describe_url_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]:
     assert not series.hasnans
     assert hasattr(series, "str")
 
-    # Transform
-    series = series.apply(urlsplit)
+    # Transform, the components of each distinct url are counted as often as the url occurs
+    value_counts = summary.get("value_counts_without_nan", None)
+    if value_counts is None:
+        value_counts = series.value_counts()
+    url_parts = (
+        value_counts.index.to_series()
+        .str.extract(URL_PATTERN, flags=re.DOTALL)
+        .fillna("")
+    )
+    url_parts["scheme"] = url_parts["scheme"].str.lower()
 
     # Update
-    summary.update(url_summary(series))
+    summary.update(url_summary(url_parts, value_counts))
 
     return series, summary
 
@@ -412,7 +545,11 @@ def describe_path_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict]
     assert not series.hasnans
     assert hasattr(series, "str")
 
-    summary.update(path_summary(series))
+    value_counts = summary.get("value_counts_without_nan", None)
+    if value_counts is None:
+        value_counts = series.value_counts()
+
+    summary.update(path_summary(value_counts))
 
     return series, summary
 
@@ -421,7 +558,7 @@ def describe_image_1d(series: pd.Series, summary: dict) -> Tuple[pd.Series, dict
     assert not series.hasnans
     assert hasattr(series, "str")
 
-    extract_exif = config["vars"]["image"]["exif"].get(bool)
+    extract_exif = config.snapshot()["vars"]["image"]["exif"]
 
     summary.update(image_summary(series, extract_exif))
 
@@ -460,17 +597,18 @@ def describe_counts_spark(
     spark_value_counts = series.value_counts()
 
     # max number of rows to visualise on histogram, most common values taken
-    to_pandas_limit = config["spark"]["to_pandas_limit"].get(int)
-    limited_results = (
-        spark_value_counts.orderBy("count", ascending=False)
-        .limit(to_pandas_limit)
-        .toPandas()
-    )
-
-    limited_results = (
-        limited_results.sort_values("count", ascending=False)
-        .set_index(series.name, drop=True)
-        .squeeze(axis="columns")
+    to_pandas_limit = int(config.snapshot()["spark"]["to_pandas_limit"])
+    limited_results = spark_to_pandas(series.value_counts(n=to_pandas_limit))
+
+    # build the series directly, the partitions are collected in any order
+    counts = limited_results["count"].to_numpy()
+    order = np.argsort(-counts, kind="mergesort")
+    limited_results = pd.Series(
+        counts[order],
+        index=pd.Index(
+            limited_results[series.name].to_numpy()[order], name=series.name
+        ),
+        name="count",
     )
 
     summary["value_counts_without_nan"] = limited_results
@@ -491,11 +629,19 @@ def describe_supported_spark(
         A dict containing calculated series description values.
     """
 
+    import pyspark.sql.functions as F
+
     # number of non-NaN observations in the Series
     count = series_description["count"]
 
-    distinct_count = series.distinct()
-    unique_count = series.unique()
+    # both counts in a single aggregation over the (persisted) value counts, as in describe_supported
+    value_counts = series_description["value_counts_without_nan_spark"]
+    distinct_stats = value_counts.agg(
+        F.count(F.lit(1)).alias("n_distinct"),
+        F.sum((F.col("count") == 1).cast("long")).alias("n_unique"),
+    ).first()
+    distinct_count = distinct_stats["n_distinct"]
+    unique_count = distinct_stats["n_unique"] or 0
 
     stats = {
         "n_distinct": distinct_count,
@@ -528,7 +674,7 @@ def describe_generic_spark(
             "n": length,
             "p_missing": summary["n_missing"] / length,
             "count": length - summary["n_missing"],
-            "memory_size": series.memory_usage(deep=config["memory_deep"].get(bool)),
+            "memory_size": series.memory_usage(deep=config.snapshot()["memory_deep"]),
         }
     )
 
@@ -549,22 +695,15 @@ def describe_numeric_spark_1d(series: SparkSeries, summary) -> Tuple[SparkSeries
 
     import pyspark.sql.functions as F
 
-    quantiles = config["vars"]["num"]["quantiles"].get(list)
+    quantiles = config.snapshot()["vars"]["num"]["quantiles"]
 
     value_counts = summary["value_counts_without_nan"]
 
-    infinity_values = [np.inf, -np.inf]
-    summary["n_infinite"] = series.dropna.where(
-        series.dropna[series.name].isin(infinity_values)
-    ).count()
-
-    summary["n_zeros"] = series.dropna.where(f"{series.name} = 0").count()
-
     stats = summary
 
     stats.update(numeric_stats_spark(series))
 
-    quantile_threshold = config["spark"]["quantile_error"].get(float)
+    quantile_threshold = float(config.snapshot()["spark"]["quantile_error"])
 
     # manual MAD computation, refactor possible
     stats.update(
@@ -614,6 +753,7 @@ def describe_numeric_spark_1d(series: SparkSeries, summary) -> Tuple[SparkSeries
             value_counts.index.values,
             summary["n_distinct"],
             weights=value_counts.values,
+            iqr=stats["iqr"],
         )
     )
 
@@ -632,8 +772,9 @@ def describe_categorical_spark_1d(
     Returns:
         A dict containing calculated series description values.
     """
-    check_length = config["vars"]["cat"]["length"].get(bool)
-    check_unicode = config["vars"]["cat"]["unicode"].get(bool)
+    cat_config = config.snapshot()["vars"]["cat"]
+    check_length = cat_config["length"]
+    check_unicode = cat_config["unicode"]
 
     # Only run if at least 1 non-missing value
     value_counts = summary["value_counts_without_nan"]
@@ -1,4 +1,5 @@
 import os
+import re
 from collections import Counter
 from datetime import datetime
 from functools import partial, singledispatch
@@ -8,7 +9,6 @@ from typing import Dict
 import numpy as np
 import pandas as pd
 from scipy.stats.stats import chisquare
-from tangled_up_in_unicode import block, block_abbr, category, category_long, script
 
 from pandas_profiling.config import config
 from pandas_profiling.model.series_wrappers import SparkSeries
@@ -36,11 +36,12 @@ def named_aggregate_summary(series, key: str):
 
 @named_aggregate_summary.register(pd.Series)
 def _named_aggregate_summary_pandas(series: pd.Series, key: str):
+    values = np.asarray(series)
     summary = {
-        f"max_{key}": np.max(series),
-        f"mean_{key}": np.mean(series),
-        f"median_{key}": np.median(series),
-        f"min_{key}": np.min(series),
+        f"max_{key}": values.max(),
+        f"mean_{key}": values.mean(),
+        f"median_{key}": np.median(values),
+        f"min_{key}": values.min(),
     }
 
     return summary
@@ -63,7 +64,7 @@ def _named_aggregate_summary_spark(series: SparkSeries, key: str):
         .T
     )
 
-    quantile_error = config["spark"]["quantile_error"].get(float)
+    quantile_error = float(config.snapshot()["spark"]["quantile_error"])
     median = lengths.stat.approxQuantile("length", [0.5], quantile_error)[0]
     summary = {
         f"max_{key}": numeric_results_df.loc["max"][0],
@@ -95,7 +96,7 @@ def _length_summary_pandas(series: pd.Series, summary: dict = {}) -> dict:
 def _length_summary_spark(series: SparkSeries, summary: dict = {}) -> dict:
     import pyspark.sql.functions as F
 
-    length_values_sample = config["spark"]["length_values_sample"].get(int)
+    length_values_sample = int(config.snapshot()["spark"]["length_values_sample"])
     if length_values_sample >= series.n_rows:
         percentage = 1.0
     else:
@@ -140,51 +141,125 @@ def file_summary(series: pd.Series) -> dict:
     return summary
 
 
-def path_summary(series: pd.Series) -> dict:
+# Splits a POSIX path into its parent (dirname with trailing separator), stem and suffix, like `posixpath`.
+# Paths may contain newlines, match with `re.DOTALL`.
+POSIX_PATH_PATTERN = r"^(?P<head>.*/)?(?P<stem>\.*[^/]*?)(?P<suffix>\.[^./]*)?\Z"
+
+# Splits a url into its components, like `urllib.parse.urlsplit`, match with `re.DOTALL`
+URL_PATTERN = (
+    r"^(?P<scheme>[^:/?#]+):(?://(?P<netloc>[^/?#]*))?(?P<path>[^?#]*)"
+    r"(?:\?(?P<query>[^#]*))?(?:#(?P<fragment>.*))?\Z"
+)
+
+
+def split_paths(series: pd.Series) -> pd.DataFrame:
+    """Split paths into their components with a single regular expression pass.
+
+    Args:
+        series: series of paths
+
+    Returns:
+        A DataFrame with the stem, suffix, name, parent and anchor of each path.
     """
+    if os.path.sep != "/" or os.path.altsep is not None:
+        return pd.DataFrame(
+            {
+                "stem": series.map(lambda x: os.path.splitext(x)[0]),
+                "suffix": series.map(lambda x: os.path.splitext(x)[1]),
+                "name": series.map(lambda x: os.path.basename(x)),
+                "parent": series.map(lambda x: os.path.dirname(x)),
+                "anchor": series.map(lambda x: os.path.splitdrive(x)[0]),
+            }
+        )
+
+    parts = series.str.extract(POSIX_PATH_PATTERN, flags=re.DOTALL).fillna("")
+    head = parts["head"]
+    # Trailing separators are removed from the parent, unless it consists of separators only
+    parent = head.str.rstrip("/")
+    parent = parent.where(parent != "", head)
+    return pd.DataFrame(
+        {
+            "stem": head + parts["stem"],
+            "suffix": parts["suffix"],
+            "name": parts["stem"] + parts["suffix"],
+            "parent": parent,
+            "anchor": "",
+        },
+        index=series.index,
+    )
+
+
+def count_parts(parts: pd.DataFrame, counts: pd.Series) -> Dict[str, pd.Series]:
+    """Count the values of each component, given the components of the distinct values.
+
+    All components are counted in a single groupby on (component, value), rather than hashing each component
+    separately.
 
     Args:
-        series: series to summarize
+        parts: the components of the distinct values, one column per component
+        counts: the number of occurrences of each distinct value
 
     Returns:
+        The value counts of each component, by component name.
+    """
+    if len(parts) == 0:
+        return {part: pd.Series([], dtype=np.int64) for part in parts.columns}
+
+    n_parts = len(parts.columns)
+    part_names = np.repeat(parts.columns.values, len(parts))
+    part_values = parts.values.ravel(order="F")
+    totals = (
+        pd.Series(np.tile(counts.values, n_parts))
+        .groupby([part_names, part_values], sort=False)
+        .sum()
+    )
 
+    part_counts = {}
+    for part in parts.columns:
+        part_total = totals.xs(part, level=0)
+        part_total.index.name = None
+        part_counts[part] = part_total.sort_values(ascending=False, kind="mergesort")
+    return part_counts
+
+
+def path_summary(value_counts: pd.Series) -> dict:
     """
 
-    # TODO: optimize using value counts
+    Args:
+        value_counts: the number of occurrences of each distinct path
+
+    Returns:
+
+    """
+    paths = value_counts.index.to_series()
+    part_counts = count_parts(split_paths(paths), value_counts)
+
+    # The common prefix of a list of strings is the common prefix of its minimum and maximum
     summary = {
-        "common_prefix": os.path.commonprefix(series.values.tolist())
+        "common_prefix": os.path.commonprefix([paths.min(), paths.max()])
         or "No common prefix",
-        "stem_counts": series.map(lambda x: os.path.splitext(x)[0]).value_counts(),
-        "suffix_counts": series.map(lambda x: os.path.splitext(x)[1]).value_counts(),
-        "name_counts": series.map(lambda x: os.path.basename(x)).value_counts(),
-        "parent_counts": series.map(lambda x: os.path.dirname(x)).value_counts(),
-        "anchor_counts": series.map(lambda x: os.path.splitdrive(x)[0]).value_counts(),
     }
-
-    summary["n_stem_unique"] = len(summary["stem_counts"])
-    summary["n_suffix_unique"] = len(summary["suffix_counts"])
-    summary["n_name_unique"] = len(summary["name_counts"])
-    summary["n_parent_unique"] = len(summary["parent_counts"])
-    summary["n_anchor_unique"] = len(summary["anchor_counts"])
+    for part in ["stem", "suffix", "name", "parent", "anchor"]:
+        summary[f"{part}_counts"] = part_counts[part]
+        summary[f"n_{part}_unique"] = len(part_counts[part])
 
     return summary
 
 
-def url_summary(series: pd.Series) -> dict:
+def url_summary(url_parts: pd.DataFrame, value_counts: pd.Series) -> dict:
     """
 
     Args:
-        series: series to summarize
+        url_parts: the components of the distinct urls, see `URL_PATTERN`
+        value_counts: the number of occurrences of each distinct url
 
     Returns:
 
     """
+    part_counts = count_parts(url_parts, value_counts)
     summary = {
-        "scheme_counts": series.map(lambda x: x.scheme).value_counts(),
-        "netloc_counts": series.map(lambda x: x.netloc).value_counts(),
-        "path_counts": series.map(lambda x: x.path).value_counts(),
-        "query_counts": series.map(lambda x: x.query).value_counts(),
-        "fragment_counts": series.map(lambda x: x.fragment).value_counts(),
+        f"{part}_counts": part_counts[part]
+        for part in ["scheme", "netloc", "path", "query", "fragment"]
     }
 
     return summary
@@ -281,7 +356,7 @@ def image_summary(series: pd.Series, exif: bool = False, hash: bool = False) ->
     )
     summary = {
         "n_truncated": sum(
-            [1 for x in image_information if "truncated" in x and x["truncated"]]
+            1 for x in image_information if "truncated" in x and x["truncated"]
         ),
         "image_dimensions": pd.Series(
             [x["size"] for x in image_information if "size" in x],
@@ -364,6 +439,9 @@ def counter_to_series(counter: Counter) -> pd.Series:
 
 
 def unicode_summary(series) -> dict:
+    # The unicode tables take a while to load, only import them when needed
+    from tangled_up_in_unicode import block, block_abbr, category, category_long, script
+
     # Unicode Character Summaries (category and script name)
 
     # this is the function that properly computes the character counts based on type
@@ -435,23 +513,58 @@ def unicode_summary(series) -> dict:
     return summary
 
 
-def histogram_compute(finite_values, n_unique, name="histogram", weights=None):
-    stats = {}
-    bins = config["plot"]["histogram"]["bins"].get(int)
-    bins = "auto" if bins == 0 else min(bins, n_unique)
+def weighted_auto_bins(values, weights, iqr=None) -> int:
+    """The number of bins numpy's "auto" estimator chooses, for values with weights.
+
+    `np.histogram` does not estimate the bins of weighted data. Like "auto", the smaller bin width of the
+    Freedman-Diaconis and Sturges estimators is used, with the interquartile range computed beforehand.
+
+    Args:
+        values: the finite values
+        weights: the weight of each value
+        iqr: the interquartile range of the values, only Sturges' estimator is used when it is not given
+
+    Returns:
+        The number of bins.
+    """
+    value_range = np.ptp(values) if len(values) > 0 else 0
+    if value_range == 0:
+        return 1
 
-    stats[name] = np.histogram(finite_values, bins=bins, weights=weights)
+    n = weights.sum()
+    width = value_range / (np.log2(n) + 1.0)
+    if iqr is not None and np.isfinite(iqr) and iqr > 0:
+        width = min(width, 2.0 * iqr * n ** (-1.0 / 3.0))
+    return int(np.ceil(value_range / width))
 
-    max_bins = config["plot"]["histogram"]["max_bins"].get(int)
-    if bins == "auto" and len(stats[name][1]) > max_bins:
-        stats[name] = np.histogram(finite_values, bins=max_bins, weights=None)
+
+def histogram_compute(
+    finite_values, n_unique, name="histogram", weights=None, iqr=None
+):
+    stats = {}
+    histogram_config = config.snapshot()["plot"]["histogram"]
+    bins = histogram_config["bins"]
+    bins = "auto" if bins == 0 else min(bins, n_unique)
+    max_bins = histogram_config["max_bins"]
+
+    if bins == "auto" and weights is not None:
+        # the estimate is unbounded for skewed values, it is limited before np.histogram allocates the bins
+        stats[name] = np.histogram(
+            finite_values,
+            bins=min(weighted_auto_bins(finite_values, weights, iqr), max_bins),
+            weights=weights,
+        )
+    else:
+        stats[name] = np.histogram(finite_values, bins=bins, weights=weights)
+        if bins == "auto" and len(stats[name][1]) > max_bins:
+            stats[name] = np.histogram(finite_values, bins=max_bins, weights=None)
 
     return stats
 
 
 def histogram_compute_spark(sparkseries, bins, n_unique, name="histogram"):
     stats = {}
-    config_bins = config["spark"]["histogram_bins"].get(int)
+    config_bins = int(config.snapshot()["spark"]["histogram_bins"])
     bins = bins if config_bins == 0 else min(bins, n_unique)
 
     spark_histogram = (
@@ -467,9 +580,110 @@ def histogram_compute_spark(sparkseries, bins, n_unique, name="histogram"):
     return stats
 
 
-def chi_square(values=None, histogram=None):
+def fast_histogram(values: np.ndarray, lo, hi, bins: int) -> np.ndarray:
+    """Count the values in `bins` equal-width bins between `lo` and `hi`.
+
+    Unlike `np.histogram`, the range is taken as given and the bin index of each value is computed directly,
+    so the values are not scanned to determine the range or sorted into the bins.
+
+    Args:
+        values: the finite values to count
+        lo: the minimum of the values
+        hi: the maximum of the values
+        bins: the number of bins
+
+    Returns:
+        The number of values per bin.
+    """
+    # the span is compared in float64, which can not tell apart large integers that are close to each other
+    span = float(hi) - float(lo)
+    if span == 0:
+        counts = np.zeros(bins, dtype=np.intp)
+        counts[0] = len(values)
+        return counts
+
+    # the offsets are computed in float64, as they overflow small integer dtypes
+    offsets = np.subtract(values, lo, dtype=np.float64)
+    indices = (offsets * (bins / span)).astype(np.intp)
+    # The maximum is part of the last bin
+    np.minimum(indices, bins - 1, out=indices)
+    return np.bincount(indices, minlength=bins)
+
+
+def integer_value_counts(series: pd.Series, max_range: int = 2 ** 16):
+    """Count the values of an integer or boolean series with `np.bincount` instead of a hash table.
+
+    Args:
+        series: the series to count, of a numpy integer or boolean dtype
+        max_range: the largest range of values (max - min) to count with a bincount
+
+    Returns:
+        The counts, ordered as `series.value_counts()` (most common first, ties by value), or None when the
+        series is empty or its values are spread too wide.
+    """
+    values = series.values
+    if len(values) == 0:
+        return None
+
+    if values.dtype.kind == "b":
+        n_true = np.count_nonzero(values)
+        values = values.view(np.uint8)
+        lo = values.dtype.type(0)
+        counts = np.array([len(values) - n_true, n_true])
+    else:
+        lo, hi = values.min(), values.max()
+        if int(hi) - int(lo) >= max_range:
+            return None
+
+        # the offsets from the minimum, computed in 64 bits so that they do not overflow small integer dtypes
+        if values.dtype.itemsize == 8:
+            offsets = values - lo
+        else:
+            offsets = values.astype(np.int64) - int(lo)
+        counts = np.bincount(offsets.astype(np.intp, copy=False))
+
+    present = np.flatnonzero(counts)
+    counts = counts[present]
+    order = np.argsort(-counts, kind="stable")
+    # modular arithmetic in the dtype of the values gives the exact keys, which are all in its range
+    keys = (lo + present[order].astype(values.dtype)).astype(series.dtype)
+    return pd.Series(counts[order], index=keys, name=series.name)
+
+
+def boolean_value_counts(series: pd.Series) -> pd.Series:
+    """Count the values of a nullable boolean series from its mask and values instead of a hash table.
+
+    Args:
+        series: the series to count, of the pandas boolean dtype
+
+    Returns:
+        The counts, as `series.value_counts(dropna=False)`.
+    """
+    missing = series.isna().values
+    n_missing = np.count_nonzero(missing)
+    n_true = np.count_nonzero(series.to_numpy(dtype=bool, na_value=False))
+    n_false = len(missing) - n_missing - n_true
+    counts = pd.Series(
+        [n_false, n_true, n_missing],
+        index=pd.Index([False, True, pd.NA], dtype=object),
+        name=series.name,
+    )
+    return counts[counts > 0].sort_values(ascending=False, kind="mergesort")
+
+
+def chi_square(values=None, histogram=None, lo=None, hi=None):
     if histogram is None:
-        histogram, _ = np.histogram(values, bins="auto")
+        values = np.asarray(values)
+        if len(values) == 0:
+            # e.g. a series of only infinite values
+            return {"statistic": np.nan, "pvalue": np.nan}
+
+        if lo is None or hi is None:
+            lo, hi = values.min(), values.max()
+        # Sturges' rule, cheaper than the "auto" estimator which computes percentiles. Constant values fall in a
+        # single bin, as with np.histogram.
+        bins = 1 if float(hi) - float(lo) == 0 else int(np.log2(len(values)) + 1)
+        histogram = fast_histogram(values, lo, hi, bins)
     return dict(chisquare(histogram)._asdict())
 
 
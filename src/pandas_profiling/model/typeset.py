@@ -8,6 +8,7 @@ import visions
 from pandas.api import types as pdt
 from visions import VisionsBaseType, VisionsTypeset
 from visions.relations import IdentityRelation, InferenceRelation
+from visions.typesets.typeset import get_type_from_path
 from visions.utils import nullable_series_contains
 
 from pandas_profiling.config import config
@@ -259,6 +260,26 @@ class ProfilingTypeSet(VisionsTypeset):
             super().__init__(types)
 
 
+def infer_and_cast(typeset: VisionsTypeset, series: pd.Series) -> tuple:
+    """Infer the type of a series and cast it to that type.
+
+    `typeset.infer_type` and `typeset.cast_to_inferred` each traverse the relation graph, testing the series
+    against every candidate type. The traversal yields both the inferred type and the cast series, so it is done
+    only once.
+
+    Args:
+        typeset: the typeset to infer the type with
+        series: the series to infer the type of
+
+    Returns:
+        A tuple with the inferred type and the cast series.
+    """
+    series, paths = typeset._traverse_graph(
+        series, typeset.root_node, typeset.relation_graph
+    )
+    return get_type_from_path(paths), series
+
+
 if __name__ == "__main__":
     from matplotlib import pyplot as plt
 
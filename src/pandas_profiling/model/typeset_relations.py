@@ -67,7 +67,7 @@ def string_to_bool(series):
 
 def numeric_is_category(series):
     n_unique = series.nunique()
-    threshold = config["vars"]["num"]["low_categorical_threshold"].get(int)
+    threshold = int(config.snapshot()["vars"]["num"]["low_categorical_threshold"])
     # TODO <= threshold OR < threshold?
     return 1 <= n_unique <= threshold
 
@@ -79,7 +79,11 @@ def to_category(series):
 
 @func_nullable_series_contains
 def series_is_string(series: pd.Series) -> bool:
-    return all(isinstance(v, str) for v in series)
+    if not pdt.is_object_dtype(series):
+        # infer_dtype can not infer all extension dtypes (e.g. periods), other dtypes stop at the first value
+        return all(isinstance(v, str) for v in series)
+    # infer_dtype checks the type of each value in C, stopping at the first value that is not a string
+    return pdt.infer_dtype(series, skipna=False) in ("string", "empty")
 
 
 def category_is_numeric(series):
@@ -131,7 +131,7 @@ class ProfileReport(SerializeReport, object):
             >>> ProfileReport(df).set_variables(title="NewTitle", html={"minify_html": False})
         """
         changed = set(vars.keys())
-        if len({"progress_bar", "pool_size"} & changed) > 0:
+        if len({"progress_bar", "pool_size", "pool_backend"} & changed) > 0:
             # Cache can persist
             pass
 
@@ -141,7 +141,17 @@ class ProfileReport(SerializeReport, object):
         if len({"html", "title"} & changed) > 0:
             self._html = None
 
-        if not {"progress_bar", "pool_size", "notebook", "html", "title"} >= changed:
+        if (
+            not {
+                "progress_bar",
+                "pool_size",
+                "pool_backend",
+                "notebook",
+                "html",
+                "title",
+            }
+            >= changed
+        ):
             # In all other cases, empty cache
             self._description_set = None
             self._title = None
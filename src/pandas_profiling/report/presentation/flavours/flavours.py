@@ -1,71 +1,68 @@
+import importlib
+from functools import lru_cache
 from typing import Dict, Type
 
 from pandas_profiling.report.presentation.core.renderable import Renderable
 
+# The core renderables, each flavour implements them as the class name with the prefix of the flavour
+_renderable_names = (
+    "Container",
+    "Variable",
+    "VariableInfo",
+    "Table",
+    "HTML",
+    "Root",
+    "Image",
+    "FrequencyTable",
+    "FrequencyTableSmall",
+    "Warnings",
+    "Duplicate",
+    "Sample",
+    "ToggleButton",
+    "Collapse",
+)
+
 
 def apply_renderable_mapping(mapping, structure, flavour):
-    for key, value in mapping.items():
-        if isinstance(structure, key):
+    # The mapped classes are unrelated, so at most one of them is a base of the structure. Look up the classes of
+    # its MRO rather than its exact type, structures that were converted to another flavour before are subclasses.
+    for cls in type(structure).__mro__:
+        value = mapping.get(cls)
+        if value is not None:
             value.convert_to_class(structure, flavour)
+            return
 
 
-def get_html_renderable_mapping() -> Dict[Type[Renderable], Type[Renderable]]:
-    """Workaround variable types annotations not being supported in Python 3.5
+@lru_cache(maxsize=None)
+def get_renderable_mapping(
+    flavour: str, prefix: str
+) -> Dict[Type[Renderable], Type[Renderable]]:
+    """Map the core renderables to their implementation in a flavour.
+
+    Only the module of the requested flavour is imported. The mapping is built once and shared, so it should not be
+    modified.
+
+    Args:
+        flavour: the name of the flavour module, e.g. "html"
+        prefix: the prefix of the class names in the flavour module, e.g. "HTML"
 
     Returns:
         types annotated mapping dict
     """
-    from pandas_profiling.report.presentation.core import (
-        HTML,
-        Collapse,
-        Container,
-        Duplicate,
-        FrequencyTable,
-        FrequencyTableSmall,
-        Image,
-        Root,
-        Sample,
-        Table,
-        ToggleButton,
-        Variable,
-        VariableInfo,
-        Warnings,
+    core = importlib.import_module("pandas_profiling.report.presentation.core")
+    implementation = importlib.import_module(
+        f"pandas_profiling.report.presentation.flavours.{flavour}"
     )
-    from pandas_profiling.report.presentation.flavours.html import (
-        HTMLHTML,
-        HTMLCollapse,
-        HTMLContainer,
-        HTMLDuplicate,
-        HTMLFrequencyTable,
-        HTMLFrequencyTableSmall,
-        HTMLImage,
-        HTMLRoot,
-        HTMLSample,
-        HTMLTable,
-        HTMLToggleButton,
-        HTMLVariable,
-        HTMLVariableInfo,
-        HTMLWarnings,
-    )
-
     return {
-        Container: HTMLContainer,
-        Variable: HTMLVariable,
-        VariableInfo: HTMLVariableInfo,
-        Table: HTMLTable,
-        HTML: HTMLHTML,
-        Root: HTMLRoot,
-        Image: HTMLImage,
-        FrequencyTable: HTMLFrequencyTable,
-        FrequencyTableSmall: HTMLFrequencyTableSmall,
-        Warnings: HTMLWarnings,
-        Duplicate: HTMLDuplicate,
-        Sample: HTMLSample,
-        ToggleButton: HTMLToggleButton,
-        Collapse: HTMLCollapse,
+        getattr(core, name): getattr(implementation, f"{prefix}{name}")
+        for name in _renderable_names
     }
 
 
+def get_html_renderable_mapping() -> Dict[Type[Renderable], Type[Renderable]]:
+    return get_renderable_mapping("html", "HTML")
+
+
 def HTMLReport(structure: Renderable):
     """Adds HTML flavour to Renderable
 
@@ -81,55 +78,7 @@ def HTMLReport(structure: Renderable):
 
 
 def get_widget_renderable_mapping() -> Dict[Type[Renderable], Type[Renderable]]:
-    from pandas_profiling.report.presentation.core import (
-        HTML,
-        Collapse,
-        Container,
-        Duplicate,
-        FrequencyTable,
-        FrequencyTableSmall,
-        Image,
-        Root,
-        Sample,
-        Table,
-        ToggleButton,
-        Variable,
-        VariableInfo,
-        Warnings,
-    )
-    from pandas_profiling.report.presentation.flavours.widget import (
-        WidgetCollapse,
-        WidgetContainer,
-        WidgetDuplicate,
-        WidgetFrequencyTable,
-        WidgetFrequencyTableSmall,
-        WidgetHTML,
-        WidgetImage,
-        WidgetRoot,
-        WidgetSample,
-        WidgetTable,
-        WidgetToggleButton,
-        WidgetVariable,
-        WidgetVariableInfo,
-        WidgetWarnings,
-    )
-
-    return {
-        Container: WidgetContainer,
-        Variable: WidgetVariable,
-        VariableInfo: WidgetVariableInfo,
-        Table: WidgetTable,
-        HTML: WidgetHTML,
-        Root: WidgetRoot,
-        Image: WidgetImage,
-        FrequencyTable: WidgetFrequencyTable,
-        FrequencyTableSmall: WidgetFrequencyTableSmall,
-        Warnings: WidgetWarnings,
-        Duplicate: WidgetDuplicate,
-        Sample: WidgetSample,
-        ToggleButton: WidgetToggleButton,
-        Collapse: WidgetCollapse,
-    }
+    return get_renderable_mapping("widget", "Widget")
 
 
 def WidgetReport(structure: Renderable):
@@ -139,55 +88,7 @@ def WidgetReport(structure: Renderable):
 
 
 def get_qt_renderable_mapping() -> Dict[Type[Renderable], Type[Renderable]]:
-    from pandas_profiling.report.presentation.core import (
-        HTML,
-        Collapse,
-        Container,
-        Duplicate,
-        FrequencyTable,
-        FrequencyTableSmall,
-        Image,
-        Root,
-        Sample,
-        Table,
-        ToggleButton,
-        Variable,
-        VariableInfo,
-        Warnings,
-    )
-    from pandas_profiling.report.presentation.flavours.qt import (
-        QtCollapse,
-        QtContainer,
-        QtDuplicate,
-        QtFrequencyTable,
-        QtFrequencyTableSmall,
-        QtHTML,
-        QtImage,
-        QtRoot,
-        QtSample,
-        QtTable,
-        QtToggleButton,
-        QtVariable,
-        QtVariableInfo,
-        QtWarnings,
-    )
-
-    return {
-        Container: QtContainer,
-        Variable: QtVariable,
-        VariableInfo: QtVariableInfo,
-        Table: QtTable,
-        HTML: QtHTML,
-        Root: QtRoot,
-        Image: QtImage,
-        FrequencyTable: QtFrequencyTable,
-        FrequencyTableSmall: QtFrequencyTableSmall,
-        Warnings: QtWarnings,
-        Duplicate: QtDuplicate,
-        Sample: QtSample,
-        Collapse: QtCollapse,
-        ToggleButton: QtToggleButton,
-    }
+    return get_renderable_mapping("qt", "Qt")
 
 
 def QtReport(structure: Renderable):
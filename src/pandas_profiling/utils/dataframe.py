@@ -124,6 +124,27 @@ def expand_mixed(df: pd.DataFrame, types=None) -> pd.DataFrame:
     return df
 
 
+def downcast_integers(series: pd.Series) -> pd.Series:
+    """Downcast an integer series to the smallest integer dtype, so that the summaries read less memory.
+
+    The dtype also holds the range of the values (max - min), which is computed in the series dtype.
+
+    Args:
+        series: the series
+
+    Returns:
+        The downcast series, or the series itself when it is not of a numpy integer dtype.
+    """
+    if series.dtype.kind not in "iu" or len(series) == 0:
+        return series
+
+    low, high = int(series.min()), int(series.max())
+    dtype = pd.to_numeric(pd.Series([low, high, high - low]), downcast="integer").dtype
+    if dtype.itemsize >= series.dtype.itemsize:
+        return series
+    return series.astype(dtype)
+
+
 def hash_dataframe(df):
     """Hash a DataFrame (wrapper around joblib.hash, might change in the future)
 
@@ -1,7 +1,9 @@
 """Plotting functions for the missing values diagrams"""
-from functools import singledispatch
+from functools import lru_cache, singledispatch
 from typing import Union
 
+import numpy as np
+import pandas as pd
 from matplotlib import pyplot as plt
 from missingno import missingno
 
@@ -24,13 +26,18 @@ def get_font_size(data: GenericDataFrame):
     Returns:
         Font size for missing values plots.
     """
-    max_label_length = max([len(label) for label in data.columns])
+    columns = data.columns
+    return _get_font_size(len(columns), max(map(len, columns)))
 
-    if len(data.columns) < 20:
+
+@lru_cache(maxsize=8)
+def _get_font_size(n_columns: int, max_label_length: int) -> float:
+    # the font size only depends on these two numbers, which are the same for all diagrams of a report
+    if n_columns < 20:
         font_size: Union[int, float] = 13
-    elif 20 <= len(data.columns) < 40:
+    elif 20 <= n_columns < 40:
         font_size = 12
-    elif 40 <= len(data.columns) < 60:
+    elif 40 <= n_columns < 60:
         font_size = 10
     else:
         font_size = 8
@@ -45,6 +52,22 @@ def missing_matrix(data) -> str:
     raise NotImplementedError("method is not implemented for datatype")
 
 
+def aggregate_missing_rows(df: pd.DataFrame, max_rows: int) -> pd.DataFrame:
+    """Aggregate the rows of a DataFrame into `max_rows` blocks of consecutive rows that are missing a value if any
+    of their rows is, so that sparse missing values still show in a missing values matrix.
+
+    Args:
+        df: The DataFrame.
+        max_rows: The number of blocks.
+
+    Returns:
+        A DataFrame with a row per block, with missing values where the block misses values.
+    """
+    starts = np.linspace(0, len(df), max_rows, endpoint=False).astype(np.intp)
+    missing = np.logical_or.reduceat(df.isna().values, starts, axis=0)
+    return pd.DataFrame(np.where(missing, np.nan, 0.0), columns=df.columns)
+
+
 @missing_matrix.register(PandasDataFrame)
 @manage_matplotlib_context()
 def _missing_matrix_pandas(data: PandasDataFrame) -> str:
@@ -56,15 +79,32 @@ def _missing_matrix_pandas(data: PandasDataFrame) -> str:
     Returns:
       The resulting missing values matrix encoded as a string.
     """
-    labels = config["plot"]["missing"]["force_labels"].get(bool)
+    snapshot = config.snapshot()
+    labels = snapshot["plot"]["missing"]["force_labels"]
+    height = 4
+    fontsize = get_font_size(data) / 20 * 16
+
+    # missingno draws the matrix as an image with a pixel per row. Rows beyond the resolution of the figure do not
+    # show, but make the image slow to draw and large to store, so the rows are aggregated into blocks.
+    df = data.get_pandas_df()
+    n_rows = len(df)
+    max_rows = height * int(snapshot["plot"]["dpi"])
+    if n_rows > max_rows:
+        df = aggregate_missing_rows(df, max_rows)
+
     missingno.matrix(
-        data.get_pandas_df(),
-        figsize=(10, 4),
-        color=hex_to_rgb(config["html"]["style"]["primary_color"].get(str)),
-        fontsize=get_font_size(data) / 20 * 16,
+        df,
+        figsize=(10, height),
+        color=hex_to_rgb(snapshot["html"]["style"]["primary_color"]),
+        fontsize=fontsize,
         sparkline=False,
         labels=labels,
     )
+    if n_rows > max_rows:
+        # label the rows with the original row numbers
+        plt.gca().set_yticklabels(
+            [1, n_rows], fontsize=int(fontsize / 16 * 20), rotation=0
+        )
     plt.subplots_adjust(left=0.1, right=0.9, top=0.7, bottom=0.2)
     return plot_360_n0sc0pe(plt)
 
@@ -86,11 +126,11 @@ def _missing_bar_pandas(data: PandasDataFrame) -> str:
     Returns:
       The resulting missing values bar plot encoded as a string.
     """
-    labels = config["plot"]["missing"]["force_labels"].get(bool)
+    labels = config.snapshot()["plot"]["missing"]["force_labels"]
     missingno.bar(
         data.get_pandas_df(),
         figsize=(10, 5),
-        color=hex_to_rgb(config["html"]["style"]["primary_color"].get(str)),
+        color=hex_to_rgb(config.snapshot()["html"]["style"]["primary_color"]),
         fontsize=get_font_size(data),
         labels=labels,
     )
@@ -112,7 +152,7 @@ def _missing_bar_spark(data: SparkDataFrame) -> str:
     Returns:
       The resulting missing values bar plot encoded as a string.
     """
-    labels = config["plot"]["missing"]["force_labels"].get(bool)
+    labels = config.snapshot()["plot"]["missing"]["force_labels"]
 
     class MissingnoBarSparkPatch(object):
         """
@@ -159,7 +199,7 @@ def _missing_bar_spark(data: SparkDataFrame) -> str:
     missingno.bar(
         MissingnoBarSparkPatch(df=data_nan_counts, original_df_size=data.n_rows),
         figsize=(10, 5),
-        color=hex_to_rgb(config["html"]["style"]["primary_color"].get(str)),
+        color=hex_to_rgb(config.snapshot()["html"]["style"]["primary_color"]),
         fontsize=get_font_size(data),
         labels=labels,
     )
@@ -198,12 +238,12 @@ def _missing_heatmap_pandas(data: PandasDataFrame) -> str:
     if len(data.columns) > 40:
         font_size /= 1.4
 
-    labels = config["plot"]["missing"]["force_labels"].get(bool)
+    labels = config.snapshot()["plot"]["missing"]["force_labels"]
     missingno.heatmap(
         data.get_pandas_df(),
         figsize=(10, height),
         fontsize=font_size,
-        cmap=config["plot"]["missing"]["cmap"].get(str),
+        cmap=config.snapshot()["plot"]["missing"]["cmap"],
         labels=labels,
     )
 
@@ -215,14 +255,14 @@ def _missing_heatmap_pandas(data: PandasDataFrame) -> str:
     return plot_360_n0sc0pe(plt)
 
 
-@manage_matplotlib_context()
 @singledispatch
+@manage_matplotlib_context()
 def missing_dendrogram(data) -> str:
     raise NotImplementedError("method is not implemented for datatype")
 
 
-@manage_matplotlib_context()
 @missing_dendrogram.register(PandasDataFrame)
+@manage_matplotlib_context()
 def _missing_dendrogram_pandas(data: PandasDataFrame) -> str:
     """Generate a dendrogram plot for missing values.
 
@@ -42,7 +42,7 @@ def _plot_histogram(
         bins[:-1] + diff / 2,  # type: ignore
         series,
         diff,
-        facecolor=config["html"]["style"]["primary_color"].get(str),
+        facecolor=config.snapshot()["html"]["style"]["primary_color"],
     )
 
     if date:
@@ -52,7 +52,7 @@ def _plot_histogram(
 
         plot.xaxis.set_major_formatter(FuncFormatter(format_fn))
 
-    if not config["plot"]["histogram"]["x_axis_labels"].get(bool):
+    if not config.snapshot()["plot"]["histogram"]["x_axis_labels"]:
         plot.set_xticklabels([])
 
     return plot
@@ -152,8 +152,9 @@ def correlation_matrix(data: pd.DataFrame, vmin: int = -1) -> str:
       The resulting correlation matrix encoded as a string.
     """
     fig_cor, axes_cor = plt.subplots()
-    cmap_name = config["plot"]["correlation"]["cmap"].get(str)
-    cmap_bad = config["plot"]["correlation"]["bad"].get(str)
+    correlation_config = config.snapshot()["plot"]["correlation"]
+    cmap_name = correlation_config["cmap"]
+    cmap_bad = correlation_config["bad"]
 
     cmap = plt.get_cmap(cmap_name)
     if vmin == 0:
@@ -204,8 +205,9 @@ def scatter_complex(series: pd.Series) -> str:
     plt.ylabel("Imaginary")
     plt.xlabel("Real")
 
-    color = config["html"]["style"]["primary_color"].get(str)
-    scatter_threshold = config["plot"]["scatter_threshold"].get(int)
+    snapshot = config.snapshot()
+    color = snapshot["html"]["style"]["primary_color"]
+    scatter_threshold = int(snapshot["plot"]["scatter_threshold"])
 
     if len(series) > scatter_threshold:
         cmap = sns.light_palette(color, as_cmap=True)
@@ -234,8 +236,9 @@ def scatter_series(series, x_label="Width", y_label="Height") -> str:
     plt.xlabel(x_label)
     plt.ylabel(y_label)
 
-    color = config["html"]["style"]["primary_color"].get(str)
-    scatter_threshold = config["plot"]["scatter_threshold"].get(int)
+    snapshot = config.snapshot()
+    color = snapshot["html"]["style"]["primary_color"]
+    scatter_threshold = int(snapshot["plot"]["scatter_threshold"])
 
     if len(series) > scatter_threshold:
         cmap = sns.light_palette(color, as_cmap=True)
@@ -266,8 +269,9 @@ def scatter_pairwise(series1, series2, x_label, y_label) -> str:
     plt.xlabel(x_label)
     plt.ylabel(y_label)
 
-    color = config["html"]["style"]["primary_color"].get(str)
-    scatter_threshold = config["plot"]["scatter_threshold"].get(int)
+    snapshot = config.snapshot()
+    color = snapshot["html"]["style"]["primary_color"]
+    scatter_threshold = int(snapshot["plot"]["scatter_threshold"])
 
     indices = (series1.notna()) & (series2.notna())
 
@@ -279,20 +283,39 @@ def scatter_pairwise(series1, series2, x_label, y_label) -> str:
     return plot_360_n0sc0pe(plt)
 
 
-@manage_matplotlib_context()
-def spark_scatter_pairwise(df, x_label, y_label) -> str:
-    """Scatter plot (or hexbin plot) from two series
+def spark_scatter_counts(df, x_label, y_label) -> pd.DataFrame:
+    """Count the occurrences of each (x, y) pair of two spark columns, dropping missing values.
 
-    Examples:
-        >>> widths = pd.Series([800, 1024])
-        >>> heights = pd.Series([600, 768])
-        >>> scatter_series(widths, heights, "Width", "Height")
+    The counts are symmetric in the labels, so the counts of (x, y) can be reused to plot (y, x).
 
     Args:
-        series1: the series corresponding to the x-axis
-        series2: the series corresponding to the y-axis
+        df: the spark dataframe
+        x_label: the first column
+        y_label: the second column
+
+    Returns:
+        A pandas DataFrame with the column(s) and a "count" column
+    """
+    columns = [x_label] if x_label == y_label else [x_label, y_label]
+    return (
+        df.get_spark_df()
+        .select(*columns)
+        .na.drop()
+        .groupby(*columns)
+        .count()
+        .toPandas()
+    )
+
+
+@manage_matplotlib_context()
+def spark_scatter_pairwise(df, x_label, y_label, counts=None) -> str:
+    """Scatter plot (or hexbin plot) from two spark columns
+
+    Args:
+        df: the spark dataframe
         x_label: the label on the x-axis
         y_label: the label on the y-axis
+        counts: the pair counts from `spark_scatter_counts`, computed when not given
 
     Returns:
         A string containing (a reference to) the image
@@ -300,33 +323,20 @@ def spark_scatter_pairwise(df, x_label, y_label) -> str:
     plt.xlabel(x_label)
     plt.ylabel(y_label)
 
-    color = config["html"]["style"]["primary_color"].get(str)
-    scatter_threshold = config["plot"]["scatter_threshold"].get(int)
-
-    if x_label == y_label:
-        df = (
-            df.get_spark_df()
-            .select(x_label)
-            .na.drop()
-            .groupby(x_label)
-            .count()
-            .toPandas()
-        )
-    else:
-        df = (
-            df.get_spark_df()
-            .select(x_label, y_label)
-            .na.drop()
-            .groupby(x_label, y_label)
-            .count()
-            .toPandas()
-        )
+    snapshot = config.snapshot()
+    color = snapshot["html"]["style"]["primary_color"]
+    scatter_threshold = int(snapshot["plot"]["scatter_threshold"])
 
-    if df["count"].sum() > scatter_threshold:
+    if counts is None:
+        counts = spark_scatter_counts(df, x_label, y_label)
+
+    if counts["count"].sum() > scatter_threshold:
         cmap = sns.light_palette(color, as_cmap=True)
-        plt.hexbin(df[x_label], df[y_label], C=df["count"], gridsize=15, cmap=cmap)
+        plt.hexbin(
+            counts[x_label], counts[y_label], C=counts["count"], gridsize=15, cmap=cmap
+        )
     else:
-        plt.scatter(df[x_label], df[y_label], s=df["count"], color=color)
+        plt.scatter(counts[x_label], counts[y_label], s=counts["count"], color=color)
     return plot_360_n0sc0pe(plt)
 
 
@@ -1,6 +1,7 @@
 """Plotting utility functions."""
 import base64
 import uuid
+from functools import lru_cache
 from io import BytesIO, StringIO
 from pathlib import Path
 from typing import Tuple, Union
@@ -9,6 +10,7 @@ from urllib.parse import quote
 from pandas_profiling.config import config
 
 
+@lru_cache(maxsize=16)
 def hex_to_rgb(hex: str) -> Tuple[float, ...]:
     """Format a hex value (#FFFFFF) as normalized RGB (1.0, 1.0, 1.0).
 
@@ -52,12 +54,13 @@ def plot_360_n0sc0pe(plt, image_format: Union[str, None] = None, attempts=0) ->
         A base64 encoded version of the plot in the specified image format.
     """
 
+    snapshot = config.snapshot()
     if image_format is None:
-        image_format = config["plot"]["image_format"].get(str)
+        image_format = snapshot["plot"]["image_format"]
     if image_format not in ["svg", "png"]:
         raise ValueError('Can only 360 n0sc0pe "png" or "svg" format.')
 
-    inline = config["html"]["inline"].get(bool)
+    inline = snapshot["html"]["inline"]
 
     mime_types = {"png": "image/png", "svg": "image/svg+xml"}
 
@@ -71,14 +74,16 @@ def plot_360_n0sc0pe(plt, image_format: Union[str, None] = None, attempts=0) ->
             else:
                 image_bytes = BytesIO()
                 plt.savefig(
-                    image_bytes, dpi=config["plot"]["dpi"].get(int), format=image_format
+                    image_bytes,
+                    dpi=int(snapshot["plot"]["dpi"]),
+                    format=image_format,
                 )
                 image_bytes.seek(0)
                 result_string = base64_image(
                     image_bytes.getvalue(), mime_types[image_format]
                 )
         else:
-            file_path = Path(config["html"]["file_name"].get(str))
+            file_path = Path(snapshot["html"]["file_name"])
             suffix = f"_assets/images/{uuid.uuid4().hex}.{image_format}"
             args = {
                 "fname": f"{file_path.with_suffix('')}{suffix}",
@@ -86,7 +91,7 @@ def plot_360_n0sc0pe(plt, image_format: Union[str, None] = None, attempts=0) ->
             }
 
             if image_format == "png":
-                args["dpi"] = config["plot"]["dpi"].get(int)
+                args["dpi"] = int(snapshot["plot"]["dpi"])
 
             plt.savefig(**args)
             result_string = f"{file_path.stem}{suffix}"
@@ -4,6 +4,7 @@ from pathlib import Path
 
 import pytest
 
+from pandas_profiling.config import config
 from pandas_profiling.model.summarizer import PandasProfilingSummarizer
 from pandas_profiling.model.typeset import ProfilingTypeSet
 from pandas_profiling.utils.cache import cache_file
@@ -47,6 +48,16 @@ def typeset():
     return ProfilingTypeSet()
 
 
+@pytest.fixture(params=["thread", "process"])
+def pool_backend(request):
+    """Run the test with each pool backend, and restore the pool settings afterwards."""
+    pool_size = config["pool_size"].get(int)
+    config["pool_backend"] = request.param
+    yield request.param
+    config["pool_size"] = pool_size
+    config["pool_backend"] = "thread"
+
+
 def pytest_runtest_setup(item):
     platforms = {"darwin", "linux", "win32"}
     supported_platforms = platforms.intersection(
@@ -1,3 +1,6 @@
+import confuse
+import pytest
+
 from pandas_profiling import ProfileReport
 from pandas_profiling.config import config
 
@@ -37,3 +40,39 @@ def test_config_shorthands():
     assert config["correlations"]["pearson"]["spark_calculate"].get(bool)
     assert not config["correlations"]["spearman"]["calculate"].get(bool)
     assert not config["missing_diagrams"]["bar"].get(bool)
+
+
+def test_config_snapshot():
+    r = ProfileReport(vars={"num": {"low_categorical_threshold": 3}})
+    assert config.snapshot()["vars"]["num"]["low_categorical_threshold"] == 3
+    r.set_variable("vars.num.low_categorical_threshold", 1)
+    assert config.snapshot()["vars"]["num"]["low_categorical_threshold"] == 1
+    config.set_kwargs({"html": {"inline": False}})
+    assert not config.snapshot()["html"]["inline"]
+    config["html"]["inline"] = True
+    assert config.snapshot()["html"]["inline"]
+    config["vars"]["num"]["low_categorical_threshold"] = 5
+
+
+def test_config_snapshot_reload():
+    sources = list(config.config.sources)
+    assert config.snapshot()["plot"]["dpi"] == 800
+    try:
+        config.config.clear()
+        config.config.add({"plot": {"dpi": 100}})
+        for source in sources[1:]:
+            config.config.add(source)
+        assert config.snapshot()["plot"]["dpi"] == 100
+    finally:
+        config.config.clear()
+        for source in sources:
+            config.config.add(source)
+
+
+def test_config_snapshot_types():
+    config["plot"]["dpi"] = "high"
+    try:
+        with pytest.raises(confuse.ConfigTypeError):
+            config.snapshot()
+    finally:
+        config["plot"]["dpi"] = 800
@@ -1,4 +1,6 @@
+import copy
 import datetime
+import multiprocessing
 
 import numpy as np
 import pandas as pd
@@ -12,8 +14,15 @@ from pandas_profiling.model.dataframe_wrappers import (
 )
 from pandas_profiling.model.describe import describe
 from pandas_profiling.model.series_wrappers import PandasSeries
-from pandas_profiling.model.summary import describe_1d
+from pandas_profiling.model.summary import (
+    describe_1d,
+    get_missing_diagrams,
+    get_nullity_frame,
+    get_pool_size,
+    use_process_pool,
+)
 from pandas_profiling.model.typeset import DateTime, Numeric, SparkNumeric
+from pandas_profiling.visualisation.missing import aggregate_missing_rows
 
 check_is_NaN = "pandas_profiling.check_is_NaN"
 
@@ -46,7 +55,7 @@ def test_describe_unique(data, is_unique, p_distinct, p_unique, summarizer, type
         assert desc_1d["is_unique"] == is_unique, "Describe 1D should return unique"
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
 def recoding_data():
     data = {
         "x": [
@@ -66,7 +75,8 @@ def recoding_data():
     return df
 
 
-@pytest.fixture
+# The data and the expected results are built once, tests that adjust them work on copies
+@pytest.fixture(scope="module")
 def describe_data():
     data = {
         "id": [chr(97 + c) for c in range(1, 9)] + ["d"],
@@ -158,7 +168,16 @@ def describe_data():
     return data
 
 
-@pytest.fixture
+@pytest.fixture(scope="module")
+def no_low_categorical_threshold():
+    # Set once for all parametrizations of the tests that describe every column as its own type
+    threshold = config["vars"]["num"]["low_categorical_threshold"].get(int)
+    config["vars"]["num"]["low_categorical_threshold"].set(0)
+    yield
+    config["vars"]["num"]["low_categorical_threshold"].set(threshold)
+
+
+@pytest.fixture(scope="module")
 def expected_results():
     return {
         "id": {
@@ -498,6 +517,8 @@ def expected_spark_results(expected_results):
     returns an exact result from the given list of variables when given a quantile, while pandas
     by default does linear interpolation
     """
+    expected_results = copy.deepcopy(expected_results)
+
     expected_results["x"]["25%"] = -3.0
     expected_results["x"]["5%"] = -10.0
     expected_results["x"]["50%"] = 0.0
@@ -560,9 +581,14 @@ def expected_spark_results(expected_results):
         "tuple",
     ],
 )
-def test_describe_df(column, describe_data, expected_results, summarizer, typeset):
-    config["vars"]["num"]["low_categorical_threshold"].set(0)
-
+def test_describe_df(
+    column,
+    describe_data,
+    expected_results,
+    summarizer,
+    typeset,
+    no_low_categorical_threshold,
+):
     describe_data_frame = PandasDataFrame(pd.DataFrame({column: describe_data[column]}))
     if column == "somedate":
         describe_data_frame.get_pandas_df()["somedate"] = pd.to_datetime(
@@ -634,12 +660,13 @@ def test_describe_spark_df(
     typeset,
     spark_session,
     spark_context,
+    no_low_categorical_threshold,
 ):
-    config["vars"]["num"]["low_categorical_threshold"].set(0)
     config["spark"]["quantile_error"].set(0)
 
     spark = spark_session
 
+    describe_data = dict(describe_data)
     if column == "mixed":
         describe_data[column] = [str(i) for i in describe_data[column]]
     if column == "bool_tf_with_nan":
@@ -692,6 +719,164 @@ def test_describe_empty(summarizer, typeset):
             describe("", empty_frame, summarizer, typeset)
 
 
+@pytest.mark.parametrize(
+    "series",
+    [
+        pd.Series([np.inf, -np.inf] * 10, name="x"),
+        pd.Series([np.inf, np.nan] * 10, name="x"),
+        pd.Series([1, -128, 127, 5, 5] * 4, dtype=np.int8, name="x"),
+    ],
+)
+def test_describe_numeric_edge_cases(
+    series, summarizer, typeset, no_low_categorical_threshold
+):
+    threshold = config["vars"]["num"]["chi_squared_threshold"].get(float)
+    config["vars"]["num"]["chi_squared_threshold"] = 0.999
+    try:
+        description = describe_1d(PandasSeries(series), summarizer, typeset)
+    finally:
+        config["vars"]["num"]["chi_squared_threshold"] = threshold
+    assert description["type"] == Numeric
+    assert "chi_squared" in description
+
+
+def test_describe_categorical_long_values(summarizer, typeset):
+    # The lengths are counted without an array as long as the longest value
+    series = pd.Series(["a", "bb", "a", "c" * 10 ** 7] * 3)
+    check_length = config["vars"]["cat"]["length"].get(bool)
+    config["vars"]["cat"]["length"] = True
+    try:
+        description = describe_1d(PandasSeries(series), summarizer, typeset)
+    finally:
+        config["vars"]["cat"]["length"] = check_length
+    assert description["max_length"] == 10 ** 7
+    counts, _ = description["histogram_length"]
+    assert list(counts) == [9, 0, 3]
+
+
 def test_describe_list(summarizer, typeset):
     with pytest.raises(NotImplementedError):
         describe("", [1, 2, 3], summarizer, typeset)
+
+
+def test_describe_pool(describe_data, summarizer, typeset, pool_backend):
+    df = PandasDataFrame(
+        pd.DataFrame({column: describe_data[column] for column in ["x", "y", "cat"]})
+    )
+
+    config["pool_size"] = 1
+    expected = describe("title", df, summarizer, typeset)["variables"]
+    config["pool_size"] = 2
+    results = describe("title", df, summarizer, typeset)["variables"]
+
+    assert list(results.keys()) == list(expected.keys())
+    for column in ["x", "y"]:
+        for key in ["mean", "std", "50%", "n_distinct", "type"]:
+            assert results[column][key] == expected[column][key]
+    assert results["cat"]["n_distinct"] == expected["cat"]["n_distinct"]
+
+
+def test_get_pool_size():
+    config["pool_size"] = 3
+    try:
+        assert get_pool_size(config["pool_size"]) == 3
+    finally:
+        config["pool_size"] = 0
+    assert get_pool_size(config["pool_size"]) == multiprocessing.cpu_count()
+
+
+def test_use_process_pool():
+    assert not use_process_pool()
+    config["pool_backend"] = "processes"
+    try:
+        with pytest.raises(ValueError):
+            use_process_pool()
+    finally:
+        config["pool_backend"] = "thread"
+
+
+@pytest.mark.parametrize(
+    "data,n_duplicates",
+    [
+        ({"a": [1, 1, 2], "b": ["x", "x", "y"]}, 1),
+        ({"a": [1, 1, 2], "id": [1, 2, 3]}, 0),
+        ({"a": [1, 1, 1], "b": [1.0, np.nan, np.nan]}, 1),
+    ],
+)
+def test_describe_duplicates(data, n_duplicates, summarizer, typeset):
+    df = PandasDataFrame(pd.DataFrame(data))
+    results = describe("title", df, summarizer, typeset)
+    assert results["table"]["n_duplicates"] == n_duplicates
+
+
+def test_get_n_largest_dups_categorical():
+    # Grouping on every combination of the categories and the float values would not fit in memory
+    data = pd.DataFrame(np.random.rand(5000, 3), columns=["a", "b", "c"])
+    data["cat"] = pd.Categorical(np.random.choice(["x", "y", "z"], 5000))
+    data = data.append(data.iloc[[0, 0, 1]], ignore_index=True)
+
+    duplicates = PandasDataFrame(data).groupby_get_n_largest_dups(
+        list(data.columns), 10
+    )
+
+    assert list(duplicates["count"]) == [3, 2]
+
+
+def test_describe_memory_deep(summarizer, typeset):
+    data = pd.DataFrame(
+        {
+            "cat": ["a", "bb", "a"],
+            "missing": ["a", None, "ccc"],
+            "bool": ["True", "False", "True"],
+            "num": [1.0, 2.0, np.nan],
+        }
+    )
+
+    config["memory_deep"] = True
+    results = describe("title", PandasDataFrame(data), summarizer, typeset)
+    config["memory_deep"] = False
+
+    assert results["table"]["memory_size"] == data.memory_usage(deep=True).sum()
+
+
+def test_get_nullity_frame():
+    data = pd.DataFrame(
+        {
+            "str": ["a", None, "b"],
+            "num": [1.0, np.nan, np.inf],
+            "date": [pd.NaT, datetime.datetime(2020, 1, 1), pd.NaT],
+        }
+    )
+
+    nullity = get_nullity_frame(PandasDataFrame(data)).get_pandas_df()
+
+    assert list(nullity.columns) == list(data.columns)
+    assert nullity.isna().equals(data.isna())
+
+
+def test_get_missing_diagrams_pool(pool_backend):
+    df = PandasDataFrame(
+        pd.DataFrame({"a": [1.0, np.nan, 3.0, np.nan], "b": [None, "x", None, "y"]})
+    )
+    table_stats = {"n_vars_with_missing": 2, "n_vars_all_missing": 0}
+
+    config["pool_size"] = 1
+    expected = get_missing_diagrams(df, table_stats)
+    config["pool_size"] = 2
+    results = get_missing_diagrams(df, table_stats)
+
+    assert list(results.keys()) == list(expected.keys())
+    assert all(isinstance(diagram["matrix"], str) for diagram in results.values())
+
+
+def test_aggregate_missing_rows():
+    # Fewer missing values than blocks, which evenly spaced rows would skip
+    data = pd.DataFrame({"a": np.arange(10000.0), "b": np.arange(10000.0)})
+    data.loc[[5, 6, 9999], "a"] = np.nan
+
+    aggregated = aggregate_missing_rows(data, 100)
+
+    assert list(aggregated.columns) == ["a", "b"]
+    assert len(aggregated) == 100
+    assert list(np.flatnonzero(aggregated["a"].isna())) == [0, 99]
+    assert aggregated["b"].notna().all()
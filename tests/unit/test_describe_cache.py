@@ -0,0 +1,109 @@
+import pandas as pd
+import pytest
+
+from pandas_profiling import clear_describe_cache, config
+from pandas_profiling.model.dataframe_wrappers import PandasDataFrame
+from pandas_profiling.model.describe import describe
+from pandas_profiling.model.describe_cache import (
+    DescribeCache,
+    config_fingerprint,
+    describe_cache,
+)
+from pandas_profiling.model.typeset import Boolean, Categorical
+
+
+@pytest.fixture
+def use_describe_cache():
+    config["describe_cache"] = True
+    yield
+    config["describe_cache"] = False
+    clear_describe_cache()
+
+
+def test_describe_cache_disabled(summarizer, typeset):
+    df = PandasDataFrame(pd.DataFrame({"x": [1.5, 2.5, 3.5]}))
+    describe("title", df, summarizer, typeset)
+    assert len(describe_cache) == 0
+
+
+def test_clear_describe_cache(summarizer, typeset, use_describe_cache):
+    df = PandasDataFrame(pd.DataFrame({"x": [1.5, 2.5, 3.5]}))
+    describe("title", df, summarizer, typeset)
+    assert len(describe_cache) == 1
+    clear_describe_cache()
+    assert len(describe_cache) == 0
+
+
+def test_describe_cache_key(summarizer, typeset):
+    cache = DescribeCache()
+    fingerprint = config_fingerprint()
+    series = pd.Series([1, 2, 3], name="x")
+
+    key = cache.key(series, summarizer, typeset, fingerprint)
+    assert key == cache.key(series.copy(), summarizer, typeset, fingerprint)
+    assert key != cache.key(series[::-1], summarizer, typeset, fingerprint)
+    assert key != cache.key(series.rename("y"), summarizer, typeset, fingerprint)
+    assert key != cache.key(series.astype(float), summarizer, typeset, fingerprint)
+
+    threshold = config["vars"]["num"]["low_categorical_threshold"].get(int)
+    config["vars"]["num"]["low_categorical_threshold"].set(threshold + 1)
+    assert fingerprint != config_fingerprint()
+    config["vars"]["num"]["low_categorical_threshold"].set(threshold)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [[1, 2], [3]],
+        [True, False],
+        ["1", "a"],
+        [None, 1.0],
+    ],
+)
+def test_describe_cache_object(values, summarizer, typeset):
+    # Object hashes collide between values that are inferred as different types, e.g. True and 1
+    cache = DescribeCache()
+    series = pd.Series(values, name="x", dtype=object)
+    assert cache.key(series, summarizer, typeset, config_fingerprint()) is None
+
+
+def test_describe_cache_types(summarizer, typeset, use_describe_cache):
+    booleans = PandasDataFrame(pd.DataFrame({"x": [True, False] * 6}, dtype=object))
+    integers = PandasDataFrame(pd.DataFrame({"x": [1, 0] * 6}, dtype=object))
+    first = describe("title", booleans, summarizer, typeset)
+    second = describe("title", integers, summarizer, typeset)
+    assert first["variables"]["x"]["type"] == Boolean
+    assert second["variables"]["x"]["type"] == Categorical
+
+
+def test_describe_cache_memory_size(summarizer, typeset, use_describe_cache):
+    df = pd.DataFrame({"x": [1.5, 2.5, 3.5]})
+    first = describe("title", PandasDataFrame(df), summarizer, typeset)
+    indexed_df = df.set_index(pd.Index(["a", "b", "c"]))
+    second = describe("title", PandasDataFrame(indexed_df), summarizer, typeset)
+    assert first["variables"]["x"]["memory_size"] == df["x"].memory_usage()
+    assert (
+        second["variables"]["x"]["memory_size"]
+        != first["variables"]["x"]["memory_size"]
+    )
+
+
+def test_describe_cache_eviction(summarizer, typeset):
+    cache = DescribeCache(max_size=2, max_rows=10, max_total_rows=15)
+    fingerprint = config_fingerprint()
+
+    keys = [
+        cache.key(pd.Series(range(n), name="x"), summarizer, typeset, fingerprint)
+        for n in [4, 5, 6, 11]
+    ]
+    assert keys[3] is None
+
+    cache.put(keys[0], {"n": 4})
+    cache.put(keys[1], {"n": 5})
+    assert cache.get(keys[0]) == {"n": 4}
+
+    # Evicts the least recently used description
+    cache.put(keys[2], {"n": 6})
+    assert len(cache) == 2
+    assert cache.get(keys[1]) is None
+    assert cache.get(keys[2]) == {"n": 6}
@@ -0,0 +1,29 @@
+from pandas_profiling.report.presentation.core import HTML, Container
+from pandas_profiling.report.presentation.flavours import HTMLReport
+from pandas_profiling.report.presentation.flavours.flavours import (
+    apply_renderable_mapping,
+)
+from pandas_profiling.report.presentation.flavours.html import (
+    HTMLHTML,
+    HTMLContainer,
+)
+
+
+def test_html_report_converts_nested_renderables():
+    structure = Container([HTML("<p>text</p>")], sequence_type="list")
+
+    HTMLReport(structure)
+
+    assert type(structure) is HTMLContainer
+    assert type(structure.content["items"][0]) is HTMLHTML
+
+
+def test_apply_renderable_mapping_converted_structure():
+    class OtherHTML(HTML):
+        pass
+
+    structure = HTMLReport(HTML("<p>text</p>"))
+
+    apply_renderable_mapping({HTML: OtherHTML}, structure, flavour=HTMLReport)
+
+    assert type(structure) is OtherHTML
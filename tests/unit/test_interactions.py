@@ -25,3 +25,17 @@ def test_interactions_target():
         [len(v.keys()) for k, v in profile.get_description()["scatter"].items()]
     )
     assert total == n_targets * n_columns
+
+
+def test_interactions_pool(pool_backend):
+    df = pd.DataFrame(np.random.rand(20, 3), columns=["a", "b", "c"])
+    df.iloc[3, 1] = np.nan
+
+    profile = df.profile_report(
+        minimal=True, pool_size=2, interactions={"continuous": True}
+    )
+
+    scatter = profile.get_description()["scatter"]
+
+    assert list(scatter.keys()) == ["a", "b", "c"]
+    assert all(plot != "" for plots in scatter.values() for plot in plots.values())
@@ -3,11 +3,13 @@ import pandas as pd
 import pytest
 
 import pandas_profiling
+from pandas_profiling.utils.cache import cache_file
 
 
-@pytest.fixture
-def tdf(get_data_file):
-    file_name = get_data_file(
+# The tests only read the DataFrame, so it is downloaded and parsed once for the module
+@pytest.fixture(scope="module")
+def tdf():
+    file_name = cache_file(
         "meteorites.csv",
         "https://data.nasa.gov/api/views/gh4g-9sfh/rows.csv?accessType=DOWNLOAD",
     )
@@ -1,5 +1,6 @@
 import os
 
+import numpy as np
 import pandas as pd
 
 from pandas_profiling.model.summarizer import PandasProfilingSummarizer, format_summary
@@ -67,3 +68,19 @@ def test_summarizer():
     _ = format_summary(
         pps.summarize(pd.Series([True, False, True, False, False]), Boolean)
     )
+
+
+def test_format_summary():
+    summary = {
+        "value_counts": pd.Series([2, 1], index=["a", "b"]),
+        "nested": {"series": pd.Series([{"x": pd.Series([1.0])}], index=["c"])},
+        "histogram": (np.array([1, 2]), np.array([0.0, 0.5, 1.0])),
+        "n": 3,
+    }
+
+    assert format_summary(summary) == {
+        "value_counts": {"a": 2, "b": 1},
+        "nested": {"series": {"c": {"x": {0: 1.0}}}},
+        "histogram": {"counts": [1, 2], "bin_edges": [0.0, 0.5, 1.0]},
+        "n": 3,
+    }
@@ -1,7 +1,21 @@
+import os
+
 import numpy as np
 import pandas as pd
+import pytest
 
-from pandas_profiling.model.summary_algorithms import describe_counts
+from pandas_profiling.config import config
+from pandas_profiling.model.summary_algorithms import describe_counts, numeric_moments
+from pandas_profiling.model.summary_helpers import (
+    boolean_value_counts,
+    chi_square,
+    count_parts,
+    fast_histogram,
+    histogram_compute,
+    integer_value_counts,
+    split_paths,
+    weighted_auto_bins,
+)
 
 
 def test_count_summary_sorted():
@@ -24,3 +38,197 @@ def test_count_summary_category():
     )
     sn, r = describe_counts(s, {})
     assert len(r["value_counts_without_nan"].index) == 2
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([1.0, 2.0, 3.5, 10.0, -4.0, 0.5]),
+        np.array([3, 3, 3, 3]),
+        np.array([1, 2, 3]),
+        np.array([7.0]),
+    ],
+)
+def test_numeric_moments(values):
+    series = pd.Series(values)
+    result = numeric_moments(values)
+    expected = {
+        "mean": series.mean(),
+        "std": series.std(),
+        "variance": series.var(),
+        "kurtosis": series.kurt(),
+        "skewness": series.skew(),
+        "sum": series.sum(),
+    }
+    for key, value in expected.items():
+        assert np.isclose(result[key], value, equal_nan=True), key
+
+
+def test_numeric_moments_float32():
+    # The deviations from a large mean lose most of their digits in float32
+    values = (10000 + np.arange(100) / 100).astype(np.float32)
+    series = pd.Series(values.astype(np.float64))
+    result = numeric_moments(values)
+    assert np.isclose(result["variance"], series.var(), rtol=1e-9)
+    assert np.isclose(result["skewness"], series.skew(), atol=1e-6)
+    assert np.isclose(result["kurtosis"], series.kurt(), rtol=1e-6)
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.arange(2 ** 61, 2 ** 62, 2 ** 55, dtype=np.int64),
+        np.arange(2 ** 63, 2 ** 64 - 2 ** 56, 2 ** 56, dtype=np.uint64),
+    ],
+)
+def test_numeric_moments_large_integers(values):
+    # The sum of the values does not fit in their dtype
+    series = pd.Series(values.astype(np.float64))
+    result = numeric_moments(values)
+    assert np.isclose(result["mean"], series.mean())
+    assert np.isclose(result["std"], series.std())
+    assert np.isclose(result["skewness"], series.skew(), atol=1e-6)
+    assert np.isclose(result["kurtosis"], series.kurt())
+
+
+def test_fast_histogram():
+    values = np.array([0.0, 0.5, 1.0, 2.5, 3.0, 3.0])
+    expected, _ = np.histogram(values, bins=3)
+    assert (fast_histogram(values, 0.0, 3.0, 3) == expected).all()
+    assert list(fast_histogram(np.array([2, 2, 2]), 2, 2, 2)) == [3, 0]
+
+
+def test_fast_histogram_small_integers():
+    # The offsets from the minimum do not fit in the dtype of the values
+    values = np.array([1, -128, 127, 5, 5], dtype=np.int8)
+    expected, _ = np.histogram(values.astype(np.int64), bins=4)
+    assert (fast_histogram(values, values.min(), values.max(), 4) == expected).all()
+
+
+def test_chi_square_empty():
+    result = chi_square(np.array([], dtype=float))
+    assert np.isnan(result["statistic"]) and np.isnan(result["pvalue"])
+
+
+def test_chi_square_constant():
+    # A single bin, as with np.histogram
+    assert chi_square(np.array([3.0] * 10))["statistic"] == 0.0
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([2 ** 62] * 4 + [2 ** 62 + 1], dtype=np.int64),
+        np.array([2 ** 63, 2 ** 63 + 2], dtype=np.uint64),
+    ],
+)
+def test_chi_square_large_integers(values):
+    # The minimum and maximum differ, but not in float64
+    assert chi_square(values)["statistic"] == 0.0
+    assert list(fast_histogram(values, values.min(), values.max(), 2)) == [
+        len(values),
+        0,
+    ]
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.arange(1000) % 37 * 0.5,
+        np.array([0.0] * 100 + [1.0, 50.0]),
+        np.array([3.0, 3.0]),
+    ],
+)
+def test_weighted_auto_bins(values):
+    unique_values, counts = np.unique(values, return_counts=True)
+    iqr = np.subtract(*np.quantile(values, [0.75, 0.25]))
+    expected = len(np.histogram_bin_edges(values, bins="auto")) - 1
+    assert weighted_auto_bins(unique_values, counts, iqr) == expected
+
+
+def test_histogram_compute_skewed():
+    # The auto estimate of the number of bins is far too large to allocate
+    values = np.array([0.0, 1e-9, 1e9])
+    counts = np.array([500000, 499990, 10])
+    iqr = 1e-9
+    assert weighted_auto_bins(values, counts, iqr) > 10 ** 18
+
+    bins = config["plot"]["histogram"]["bins"].get(int)
+    config["plot"]["histogram"]["bins"] = 0
+    try:
+        histogram, edges = histogram_compute(values, 3, weights=counts, iqr=iqr)[
+            "histogram"
+        ]
+    finally:
+        config["plot"]["histogram"]["bins"] = bins
+    assert len(edges) == config["plot"]["histogram"]["max_bins"].get(int) + 1
+    assert histogram.sum() == counts.sum()
+
+
+def test_split_paths():
+    paths = [
+        "/a/b.txt",
+        "/a/.bashrc",
+        "/a//b.tar.gz",
+        "/",
+        "//a",
+        "a",
+        "/a/b.",
+        "/a\nb/c.txt",
+        "/a/b.txt\n",
+    ]
+    result = split_paths(pd.Series(paths))
+    for (_, parts), path in zip(result.iterrows(), paths):
+        assert parts["stem"] == os.path.splitext(path)[0]
+        assert parts["suffix"] == os.path.splitext(path)[1]
+        assert parts["name"] == os.path.basename(path)
+        assert parts["parent"] == os.path.dirname(path)
+
+
+def test_count_parts():
+    value_counts = pd.Series([3, 2, 1], index=["/a/b.txt", "/a/c.csv", "/d/e.txt"])
+    part_counts = count_parts(split_paths(value_counts.index.to_series()), value_counts)
+    assert part_counts["suffix"].to_dict() == {".txt": 4, ".csv": 2}
+    assert part_counts["parent"].to_dict() == {"/a": 5, "/d": 1}
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        np.array([3, 1, 1, 2, 2, 2, -5]),
+        np.array([-128, 127, 127], dtype=np.int8),
+        np.array([2 ** 63 + 3, 2 ** 63 + 1, 2 ** 63 + 3], dtype=np.uint64),
+        np.array([True, False, True]),
+    ],
+)
+def test_integer_value_counts(values):
+    series = pd.Series(values, name="x")
+    result = integer_value_counts(series)
+    expected = series.value_counts()
+    assert result.to_dict() == expected.to_dict()
+    assert list(result.values) == list(expected.values)
+    assert result.index.dtype == expected.index.dtype
+    assert result.name == expected.name
+
+
+@pytest.mark.parametrize(
+    "values",
+    [
+        [True, False, None, True],
+        [False, False, True],
+        [None, None],
+    ],
+)
+def test_boolean_value_counts(values):
+    series = pd.Series(values, dtype="boolean", name="x")
+    result = boolean_value_counts(series)
+    expected = series.value_counts(dropna=False)
+    expected = expected[expected > 0]
+    assert result.to_dict() == expected.to_dict()
+    assert list(result.values) == list(expected.values)
+    assert result.name == expected.name
+
+
+def test_integer_value_counts_wide():
+    assert integer_value_counts(pd.Series([0, 2 ** 20])) is None
+    assert integer_value_counts(pd.Series([], dtype=int)) is None
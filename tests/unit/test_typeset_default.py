@@ -110,6 +110,7 @@ contains_map[Unsupported] = {
     "timedelta_series",
     "timedelta_series_nat",
     "timedelta_negative",
+    "period_series",
     "path_series_linux",
     "path_series_linux_missing",
     "path_series_windows",
@@ -209,6 +210,7 @@ inference_map = {
     "timedelta_series": Unsupported,
     "timedelta_series_nat": Unsupported,
     "timedelta_negative": Unsupported,
+    "period_series": Unsupported,
     "geometry_string_series": Categorical,
     "geometry_series_missing": Unsupported,
     "geometry_series": Unsupported,
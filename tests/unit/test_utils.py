@@ -3,7 +3,12 @@ from pathlib import Path
 import pandas as pd
 import pytest
 
-from pandas_profiling.utils.dataframe import expand_mixed, read_pandas, warn_read
+from pandas_profiling.utils.dataframe import (
+    downcast_integers,
+    expand_mixed,
+    read_pandas,
+    warn_read,
+)
 
 
 def test_read_pandas_parquet():
@@ -47,3 +52,20 @@ def test_expand():
     df = pd.DataFrame(data=[{"name": "John", "age": 30}, {"name": "Alice", "age": 25}])
     expanded_df = expand_mixed(df)
     assert expanded_df.shape == (2, 2)
+
+
+@pytest.mark.parametrize(
+    "values,dtype",
+    [
+        ([1, 2, 3], "int8"),
+        ([-100, 100], "int16"),
+        ([0, 2 ** 40], "int64"),
+        ([1.0, 2.0], "float64"),
+        (["a", "b"], "object"),
+    ],
+)
+def test_downcast_integers(values, dtype):
+    series = pd.Series(values)
+    downcast = downcast_integers(series)
+    assert downcast.dtype == dtype
+    assert (downcast == series).all()
@@ -238,6 +238,10 @@ def get_series():
             ],
             name="timedelta_negative",
         ),
+        # Period Series
+        pd.Series(
+            pd.period_range("2020-01-01", periods=3, freq="D"), name="period_series"
+        ),
         # Path Series
         pd.Series(
             [